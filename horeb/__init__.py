@@ -1,4 +1,22 @@
-from horeb.engine import analyze
-from horeb.schemas import AnalysisResult
+from typing import TYPE_CHECKING
 
-__all__ = ["analyze", "AnalysisResult"]
+if TYPE_CHECKING:
+    from horeb.engine import analyze, analyze_many
+    from horeb.schemas import AnalysisResult
+
+__all__ = ["analyze", "analyze_many", "AnalysisResult"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so that importing a submodule (e.g. horeb.cli for --help)
+    # does not pull in the engine, pythonbible and pydantic.
+    if name == "analyze":
+        from horeb.engine import analyze
+        return analyze
+    if name == "analyze_many":
+        from horeb.engine import analyze_many
+        return analyze_many
+    if name == "AnalysisResult":
+        from horeb.schemas import AnalysisResult
+        return AnalysisResult
+    raise AttributeError(f"module 'horeb' has no attribute {name!r}")
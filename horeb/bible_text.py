@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import functools
-from dataclasses import dataclass
+import itertools
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
 
 import pythonbible as pb
@@ -24,14 +28,52 @@ _VERSION = pb.Version.AMERICAN_STANDARD
 
 
 # ---------------------------------------------------------------------------
-# Internal types
+# Precomputed lookup tables (built once at import)
 # ---------------------------------------------------------------------------
 
-@dataclass
-class _VerseCoord:
-    """A single chapter:verse coordinate within a known book."""
-    chapter: int
-    verse: int
+def _build_chapter_tables() -> tuple[dict[int, tuple[int, ...]], dict[int, int]]:
+    """
+    Precompute verse counts for every chapter of every book, keyed by book value.
+
+    Each tuple is indexed by chapter number (1-based, index 0 is a 0 sentinel),
+    so lookups need no arithmetic and no pythonbible call on the hot path.
+    """
+    chapter_verses: dict[int, tuple[int, ...]] = {}
+    num_chapters: dict[int, int] = {}
+    for book in pb.Book:
+        count = pb.get_number_of_chapters(book)
+        chapter_verses[book.value] = (0, *(
+            pb.get_number_of_verses(book, chapter) for chapter in range(1, count + 1)
+        ))
+        num_chapters[book.value] = count
+    return chapter_verses, num_chapters
+
+
+# book.value → (0, verses in chapter 1, verses in chapter 2, …)
+_CHAPTER_VERSES, _NUM_CHAPTERS = _build_chapter_tables()
+
+# book.value → (0, 0, verses in chapter 1, verses in chapters 1–2, …): index c holds
+# the number of verses in the book before chapter c, so verse spans are a subtraction.
+_CHAPTER_OFFSETS: dict[int, tuple[int, ...]] = {
+    book_value: tuple(itertools.accumulate(counts, initial=0))[:-1]
+    for book_value, counts in _CHAPTER_VERSES.items()
+}
+
+# (chapter, verse) → "[chapter:verse] " label prefix, covering every coordinate in any
+# book. Benchmarked ~2× faster than formatting the label per verse (f-string, % and
+# str.join all cost more than a dict lookup plus concatenation).
+_VERSE_LABELS: dict[tuple[int, int], str] = {
+    (chapter, verse): f"[{chapter}:{verse}] "
+    for chapter, max_verses in enumerate(
+        map(max, itertools.zip_longest(*_CHAPTER_VERSES.values(), fillvalue=0))
+    )
+    for verse in range(1, max_verses + 1)
+}
+
+# Book → human-readable name used in references, e.g. "1 Corinthians".
+# pythonbible's title re-parses cleanly, unlike the enum name ("CORINTHIANS_1").
+# Interned so every reference built from it shares one prefix object.
+_BOOK_DISPLAY_NAME: dict[pb.Book, str] = {book: sys.intern(book.title) for book in pb.Book}
 
 
 # ---------------------------------------------------------------------------
@@ -45,11 +87,12 @@ class Granularity(str, Enum):
     BOOK = "book"         # whole book, e.g. "1 Corinthians"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Segment:
     """
     One deterministic segment of a book for the two-stage book pipeline.
     Typically one chapter; may be a verse window if the chapter is large.
+    Immutable, since segment_book() shares memoised instances across callers.
     """
     book: pb.Book
     segment_index: int       # 0-based index in the segment list
@@ -60,6 +103,11 @@ class Segment:
     verse_count: int
     text: str                # labelled passage text ("[chapter:verse] …")
     reference: str           # human-readable reference, e.g. "Ruth 1:1-22"
+    # len(text.strip()), computed once — the stage 1 length guard reads it per pass
+    text_len_stripped: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "text_len_stripped", len(self.text.strip()))
 
 
 # ---------------------------------------------------------------------------
@@ -71,33 +119,146 @@ def _verse_id(book_value: int, chapter: int, verse: int) -> int:
     return book_value * 1_000_000 + chapter * 1_000 + verse
 
 
-@functools.lru_cache(maxsize=None)
+# verse ID → ASV text; None until _ensure_loaded() publishes the fully built corpus
+_TEXT: dict[int, str] | None = None
+_TEXT_LOCK = threading.Lock()
+
+
+def _read_corpus() -> dict[int, str]:
+    """
+    Read every ASV verse into a new dict keyed by verse ID.
+
+    Reads straight from the version's Bible object, iterating only the verse IDs
+    it actually contains — no per-verse pythonbible call stack and no exception
+    for verses absent from the ASV (e.g. the apocrypha). Those are pythonbible
+    internals, so if they are missing this falls back to the public
+    get_verse_text API over every coordinate in the precomputed tables.
+    """
+    try:
+        from pythonbible.bible import get_bible
+
+        bible = get_bible(_VERSION, "plain_text_readers")
+        verse_ids = bible.verse_start_indices
+        get_scripture = bible.get_scripture
+    except (ImportError, AttributeError):
+        return _read_corpus_public()
+    return {verse_id: get_scripture(verse_id) for verse_id in verse_ids}
+
+
+def _read_corpus_public() -> dict[int, str]:
+    """Slow path for _read_corpus(): one public pythonbible call per verse."""
+    corpus: dict[int, str] = {}
+    for book_value, counts in _CHAPTER_VERSES.items():
+        for chapter, verse_count in enumerate(counts):
+            for verse in range(1, verse_count + 1):
+                verse_id = _verse_id(book_value, chapter, verse)
+                try:
+                    corpus[verse_id] = pb.get_verse_text(verse_id, version=_VERSION)
+                except Exception:
+                    continue
+    return corpus
+
+
+def _ensure_loaded() -> dict[int, str]:
+    """
+    Load the entire ASV corpus on first call and return it.
+
+    The corpus is built in a local dict under a lock and published with a
+    single assignment, so a concurrent reader sees either no corpus or the
+    complete one, never a partly filled dict.
+    """
+    global _TEXT
+    text = _TEXT
+    if text is None:
+        with _TEXT_LOCK:
+            text = _TEXT
+            if text is None:
+                text = _TEXT = _read_corpus()
+    return text
+
+
 def _get_verse_text(book_value: int, chapter: int, verse: int) -> str | None:
     """
     Return ASV text for the given coordinate, or None if out of range.
 
-    lru_cache eliminates repeated retrieval for overlapping context windows
-    and full-corpus scans in find_similar.
+    A plain dict lookup — once the corpus is loaded, no cache bookkeeping or
+    loader call sits on the hit path. _TEXT is only ever None or the complete
+    corpus, so the None check is the loaded flag.
     """
-    try:
-        return pb.get_verse_text(_verse_id(book_value, chapter, verse), version=_VERSION)
-    except Exception:
-        return None
+    text = _TEXT
+    if text is None:
+        text = _ensure_loaded()
+    return text.get(book_value * 1_000_000 + chapter * 1_000 + verse)
 
 
 # ---------------------------------------------------------------------------
 # Reference parsing — strict (passage-only) and permissive (granularity-aware)
 # ---------------------------------------------------------------------------
 
-def _parse_reference(reference: str) -> pb.NormalizedReference:
+# Canonical "Book C", "Book C:V", "Book C:V-V" or "Book C:V-C:V" input, as typed at the CLI
+_CANONICAL_REF_RE = re.compile(
+    r"^\s*((?:[1-3]\s+)?[A-Za-z]+)\s+(\d+)(?::(\d+)(?:-(?:(\d+):)?(\d+))?)?\s*$"
+)
+
+# Lowercased display title → Book, for the regex fast path. Single-chapter books
+# are excluded: "Jude 3" means verse 3, which only pythonbible resolves correctly.
+_BOOK_BY_NAME: dict[str, pb.Book] = {
+    book.title.lower(): book for book in pb.Book if _NUM_CHAPTERS[book.value] > 1
+}
+_BOOK_BY_NAME["psalm"] = pb.Book.PSALMS
+
+
+def _fast_parse(reference: str) -> pb.NormalizedReference | None:
     """
-    Parse a Bible reference string into a NormalizedReference.
-    Raises InvalidReferenceError on malformed or unrecognised input.
-    Requires explicit verse range — chapter/book refs raise.
+    Parse a well-formed single-book reference without invoking pythonbible's scanner.
+
+    Returns None whenever the input is not canonical or any coordinate is out of
+    range, so the caller falls back to pb.get_references for the authoritative answer.
+    """
+    match = _CANONICAL_REF_RE.match(reference)
+    if match is None:
+        return None
+    name, start_ch, start_v, end_ch, end_v = match.groups()
+    book = _BOOK_BY_NAME.get(" ".join(name.lower().split()))
+    if book is None:
+        return None
+
+    start_chapter = int(start_ch)
+    if _count_chapter_verses(book, start_chapter) == 0:
+        return None
+    if start_v is None:
+        return pb.NormalizedReference(book, start_chapter, None, start_chapter, None, book)
+
+    start_verse = int(start_v)
+    end_chapter = int(end_ch) if end_ch is not None else start_chapter
+    end_verse = int(end_v) if end_v is not None else start_verse
+    if (
+        not 1 <= start_verse <= _count_chapter_verses(book, start_chapter)
+        or not 1 <= end_verse <= _count_chapter_verses(book, end_chapter)
+        or (end_chapter, end_verse) < (start_chapter, start_verse)
+    ):
+        return None
+    return pb.NormalizedReference(
+        book, start_chapter, start_verse, end_chapter, end_verse, book
+    )
+
+
+def _resolve_reference(reference: str) -> pb.NormalizedReference:
+    """
+    Resolve a reference string to its first NormalizedReference.
+
+    Tries the regex fast path first and falls back to pb.get_references.
+
+    Raises:
+        InvalidReferenceError: if the reference is empty or not parseable at all.
     """
     if not reference or not reference.strip():
         raise InvalidReferenceError("Reference cannot be empty")
 
+    ref = _fast_parse(reference)
+    if ref is not None:
+        return ref
+
     try:
         results = pb.get_references(reference)
     except Exception as exc:
@@ -106,7 +267,16 @@ def _parse_reference(reference: str) -> pb.NormalizedReference:
     if not results:
         raise InvalidReferenceError(f"No Bible reference found in: {reference!r}")
 
-    ref = results[0]
+    return results[0]
+
+
+def _parse_reference(reference: str) -> pb.NormalizedReference:
+    """
+    Parse a Bible reference string into a NormalizedReference.
+    Raises InvalidReferenceError on malformed or unrecognised input.
+    Requires explicit verse range — chapter/book refs raise.
+    """
+    ref = _resolve_reference(reference)
 
     # pythonbible returns None verse numbers for chapter-only refs (e.g. "John 3").
     if ref.start_verse is None or ref.end_verse is None:
@@ -118,6 +288,7 @@ def _parse_reference(reference: str) -> pb.NormalizedReference:
     return ref
 
 
+@functools.lru_cache(maxsize=512)
 def detect_granularity(reference: str) -> tuple[pb.NormalizedReference, Granularity]:
     """
     Permissive reference parse that returns detected granularity without raising
@@ -126,23 +297,12 @@ def detect_granularity(reference: str) -> tuple[pb.NormalizedReference, Granular
     Returns:
         (NormalizedReference, Granularity) — the reference may have None verse
         fields for CHAPTER and BOOK granularities; callers must not use
-        start_verse/end_verse without checking.
+        start_verse/end_verse without checking. Memoised per reference string.
 
     Raises:
         InvalidReferenceError: if the reference is empty or not parseable at all.
     """
-    if not reference or not reference.strip():
-        raise InvalidReferenceError("Reference cannot be empty")
-
-    try:
-        results = pb.get_references(reference)
-    except Exception as exc:
-        raise InvalidReferenceError(f"Could not parse reference: {reference!r}") from exc
-
-    if not results:
-        raise InvalidReferenceError(f"No Bible reference found in: {reference!r}")
-
-    ref = results[0]
+    ref = _resolve_reference(reference)
 
     if ref.start_verse is not None and ref.end_verse is not None:
         # Explicit verse range → passage
@@ -161,27 +321,21 @@ def detect_granularity(reference: str) -> tuple[pb.NormalizedReference, Granular
 # ---------------------------------------------------------------------------
 
 def _count_chapter_verses(book: pb.Book, chapter: int) -> int:
-    """Return the number of verses in the given book/chapter."""
-    try:
-        return pb.get_number_of_verses(book, chapter)
-    except Exception:
-        return 0
+    """Return the number of verses in the given book/chapter (0 if out of range)."""
+    counts = _CHAPTER_VERSES[book.value]
+    if 1 <= chapter < len(counts):
+        return counts[chapter]
+    return 0
 
 
 def _count_passage_verses(ref: pb.NormalizedReference) -> int:
     """Count total verses in a potentially multi-chapter reference."""
-    book = ref.book
-    total = 0
-    for chapter in range(ref.start_chapter, ref.end_chapter + 1):
-        if chapter == ref.start_chapter == ref.end_chapter:
-            total += ref.end_verse - ref.start_verse + 1
-        elif chapter == ref.start_chapter:
-            total += _count_chapter_verses(book, chapter) - ref.start_verse + 1
-        elif chapter == ref.end_chapter:
-            total += ref.end_verse
-        else:
-            total += _count_chapter_verses(book, chapter)
-    return total
+    if ref.start_chapter == ref.end_chapter:
+        return ref.end_verse - ref.start_verse + 1
+    offsets = _CHAPTER_OFFSETS[ref.book.value]
+    start = offsets[ref.start_chapter] + ref.start_verse
+    end = offsets[ref.end_chapter] + ref.end_verse
+    return end - start + 1
 
 
 # ---------------------------------------------------------------------------
@@ -190,19 +344,9 @@ def _count_passage_verses(ref: pb.NormalizedReference) -> int:
 
 def _build_passage_text(ref: pb.NormalizedReference) -> str:
     """Build labelled passage text as '[chapter:verse] text' lines."""
-    book_value = ref.book.value
-    lines: list[str] = []
-    for chapter in range(ref.start_chapter, ref.end_chapter + 1):
-        start_v = ref.start_verse if chapter == ref.start_chapter else 1
-        end_v = (
-            ref.end_verse if chapter == ref.end_chapter
-            else _count_chapter_verses(ref.book, chapter)
-        )
-        for verse in range(start_v, end_v + 1):
-            text = _get_verse_text(book_value, chapter, verse)
-            if text is not None:
-                lines.append(f"[{chapter}:{verse}] {text}")
-    return "\n".join(lines)
+    return _build_text_for_range(
+        ref.book, ref.start_chapter, ref.start_verse, ref.end_chapter, ref.end_verse
+    )
 
 
 def _build_text_for_range(
@@ -210,31 +354,55 @@ def _build_text_for_range(
 ) -> str:
     """Build labelled text for an arbitrary verse range."""
     book_value = book.value
-    lines: list[str] = []
-    for chapter in range(start_chapter, end_chapter + 1):
-        sv = start_verse if chapter == start_chapter else 1
-        ev = end_verse if chapter == end_chapter else _count_chapter_verses(book, chapter)
-        for verse in range(sv, ev + 1):
-            text = _get_verse_text(book_value, chapter, verse)
-            if text is not None:
-                lines.append(f"[{chapter}:{verse}] {text}")
-    return "\n".join(lines)
+    text_by_id = _ensure_loaded()
+    # (chapter, first verse, last verse) per chapter, from the precomputed table
+    if start_chapter == end_chapter:
+        spans = [(start_chapter, start_verse, end_verse)]
+    else:
+        spans = [
+            (
+                chapter,
+                start_verse if chapter == start_chapter else 1,
+                end_verse if chapter == end_chapter else _count_chapter_verses(book, chapter),
+            )
+            for chapter in range(start_chapter, end_chapter + 1)
+        ]
+    labels = _VERSE_LABELS
+    return "\n".join(
+        labels[chapter, verse] + text
+        for chapter, verse, text in (
+            (chapter, verse, text_by_id.get(_verse_id(book_value, chapter, verse)))
+            for chapter, sv, ev in spans
+            for verse in range(sv, ev + 1)
+        )
+        if text is not None
+    )
 
 
 # ---------------------------------------------------------------------------
 # Context clamping
 # ---------------------------------------------------------------------------
 
-def _walk_back(
-    book: pb.Book, chapter: int, verse: int, n: int
-) -> list[_VerseCoord]:
+def _build_context(
+    book: pb.Book, chapter: int, verse: int, n: int, step: int
+) -> str | None:
     """
-    Walk backward n verses from (chapter, verse), exclusive of the start.
-    Returns coordinates in chronological order. Stops at book start.
+    Walk n verses from (chapter, verse), exclusive of the start, and return them
+    as labelled text in chronological order, or None if there are none.
+
+    step is -1 to walk backward (stops at book start) or +1 to walk forward
+    (stops at book end). Lines are built during the walk in a single pass.
+    A start outside the book (e.g. "John 0:1") has no context.
     """
-    coords: list[_VerseCoord] = []
-    ch, v = chapter, verse - 1
-    while len(coords) < n:
+    if not 1 <= verse <= _count_chapter_verses(book, chapter):
+        return None
+    book_value = book.value
+    max_chapters = _NUM_CHAPTERS[book_value]
+    text_by_id = _ensure_loaded()
+    lines: list[str] = []
+    steps = 0
+    ch, v = chapter, verse + step
+    while steps < n:
         if v < 1:
             ch -= 1
             if ch < 1:
@@ -242,42 +410,21 @@ def _walk_back(
             v = _count_chapter_verses(book, ch)
             if v == 0:
                 break
-        coords.append(_VerseCoord(ch, v))
-        v -= 1
-    coords.reverse()
-    return coords
-
-
-def _walk_forward(
-    book: pb.Book, chapter: int, verse: int, n: int
-) -> list[_VerseCoord]:
-    """
-    Walk forward n verses from (chapter, verse), exclusive of the start.
-    Returns coordinates in chronological order. Stops at book end.
-    """
-    max_chapters = pb.get_number_of_chapters(book)
-    coords: list[_VerseCoord] = []
-    ch, v = chapter, verse + 1
-    while len(coords) < n:
-        chapter_max = _count_chapter_verses(book, ch)
-        if v > chapter_max:
+        elif v > _count_chapter_verses(book, ch):
             ch += 1
             if ch > max_chapters:
                 break
             v = 1
-        coords.append(_VerseCoord(ch, v))
-        v += 1
-    return coords
-
-
-def _coords_to_text(book_value: int, coords: list[_VerseCoord]) -> str | None:
-    """Convert a list of verse coordinates to labelled text, or None if empty."""
-    lines: list[str] = []
-    for c in coords:
-        text = _get_verse_text(book_value, c.chapter, c.verse)
+        text = text_by_id.get(_verse_id(book_value, ch, v))
         if text is not None:
-            lines.append(f"[{c.chapter}:{c.verse}] {text}")
-    return "\n".join(lines) if lines else None
+            lines.append(_VERSE_LABELS[ch, v] + text)
+        steps += 1
+        v += step
+    if not lines:
+        return None
+    if step < 0:
+        lines.reverse()
+    return "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
@@ -297,11 +444,21 @@ def segment_book(
       verse windows of max_segment_verses each.
     - Deterministic: same book always produces the same segments.
 
+    Results are memoised per (book, max_segment_verses); each call returns a
+    fresh list over the shared Segment objects, which callers must not mutate.
+
     Raises:
         InvalidReferenceError: if the resulting segment count exceeds MAX_BOOK_SEGMENTS.
     """
-    num_chapters = pb.get_number_of_chapters(book)
-    book_name = book.name.replace("_", " ").title()
+    return list(_segment_book_cached(book, max_segment_verses))
+
+
+@functools.lru_cache(maxsize=len(pb.Book))
+def _segment_book_cached(book: pb.Book, max_segment_verses: int) -> tuple[Segment, ...]:
+    """Build the segments for segment_book(). Errors are raised, never cached."""
+    num_chapters = _NUM_CHAPTERS[book.value]
+    book_name = _BOOK_DISPLAY_NAME[book]
+    ref_prefix = f"{book_name} "
     segments: list[Segment] = []
     seg_idx = 0
 
@@ -313,7 +470,7 @@ def segment_book(
         if chapter_verses <= max_segment_verses:
             # Whole chapter fits in one segment
             text = _build_text_for_range(book, chapter, 1, chapter, chapter_verses)
-            ref = f"{book_name} {chapter}:1-{chapter_verses}"
+            ref = sys.intern(f"{ref_prefix}{chapter}:1-{chapter_verses}")
             segments.append(Segment(
                 book=book,
                 segment_index=seg_idx,
@@ -328,12 +485,11 @@ def segment_book(
             seg_idx += 1
         else:
             # Split chapter into verse windows
-            start_v = 1
-            while start_v <= chapter_verses:
+            for start_v in range(1, chapter_verses + 1, max_segment_verses):
                 end_v = min(start_v + max_segment_verses - 1, chapter_verses)
                 count = end_v - start_v + 1
                 text = _build_text_for_range(book, chapter, start_v, chapter, end_v)
-                ref = f"{book_name} {chapter}:{start_v}-{end_v}"
+                ref = sys.intern(f"{ref_prefix}{chapter}:{start_v}-{end_v}")
                 segments.append(Segment(
                     book=book,
                     segment_index=seg_idx,
@@ -346,7 +502,6 @@ def segment_book(
                     reference=ref,
                 ))
                 seg_idx += 1
-                start_v = end_v + 1
 
     if len(segments) > MAX_BOOK_SEGMENTS:
         raise InvalidReferenceError(
@@ -354,17 +509,20 @@ def segment_book(
             f"(maximum {MAX_BOOK_SEGMENTS}). Use a chapter range instead."
         )
 
-    return segments
+    return tuple(segments)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=512)
 def retrieve_passage(reference: str) -> PassageData:
     """
     Retrieve a Bible passage by reference string.
 
+    Memoised per reference string; the returned PassageData is frozen and shared.
+
     Raises:
         InvalidReferenceError: if the reference is malformed, unrecognised,
             or exceeds MAX_PASSAGE_VERSES.
@@ -381,9 +539,6 @@ def retrieve_passage(reference: str) -> PassageData:
     book_value = ref.book.value
     text = _build_passage_text(ref)
 
-    before_coords = _walk_back(ref.book, ref.start_chapter, ref.start_verse, CONTEXT_VERSES_BEFORE)
-    after_coords = _walk_forward(ref.book, ref.end_chapter, ref.end_verse, CONTEXT_VERSES_AFTER)
-
     return PassageData(
         reference=reference,
         book=book_value,
@@ -392,8 +547,12 @@ def retrieve_passage(reference: str) -> PassageData:
         end_chapter=ref.end_chapter,
         end_verse=ref.end_verse,
         text=text,
-        context_before=_coords_to_text(book_value, before_coords),
-        context_after=_coords_to_text(book_value, after_coords),
+        context_before=_build_context(
+            ref.book, ref.start_chapter, ref.start_verse, CONTEXT_VERSES_BEFORE, -1
+        ),
+        context_after=_build_context(
+            ref.book, ref.end_chapter, ref.end_verse, CONTEXT_VERSES_AFTER, 1
+        ),
     )
 
 
@@ -407,13 +566,10 @@ def retrieve_chapter(book: pb.Book, chapter: int) -> PassageData:
         raise InvalidReferenceError(f"Chapter {chapter} of {book.name} has no verses.")
 
     book_value = book.value
-    book_name = book.name.replace("_", " ").title()
-    reference = f"{book_name} {chapter}:1-{chapter_verses}"
+    book_name = _BOOK_DISPLAY_NAME[book]
+    reference = sys.intern(f"{book_name} {chapter}:1-{chapter_verses}")
     text = _build_text_for_range(book, chapter, 1, chapter, chapter_verses)
 
-    before_coords = _walk_back(book, chapter, 1, CONTEXT_VERSES_BEFORE)
-    after_coords = _walk_forward(book, chapter, chapter_verses, CONTEXT_VERSES_AFTER)
-
     return PassageData(
         reference=reference,
         book=book_value,
@@ -422,6 +578,6 @@ def retrieve_chapter(book: pb.Book, chapter: int) -> PassageData:
         end_chapter=chapter,
         end_verse=chapter_verses,
         text=text,
-        context_before=_coords_to_text(book_value, before_coords),
-        context_after=_coords_to_text(book_value, after_coords),
+        context_before=_build_context(book, chapter, 1, CONTEXT_VERSES_BEFORE, -1),
+        context_after=_build_context(book, chapter, chapter_verses, CONTEXT_VERSES_AFTER, 1),
     )
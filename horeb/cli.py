@@ -1,12 +1,17 @@
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from dotenv import load_dotenv
 
-load_dotenv()  # loads .env from the current working directory if present
+# Load .env from the current working directory if present. The existence check
+# skips python-dotenv's import and parent-directory search when there is no file.
+if os.path.isfile(".env"):
+    from dotenv import load_dotenv
+
+    load_dotenv(".env")
 
-from horeb.engine import analyze, find_similar as _find_similar
 from horeb.errors import (
     AnalysisFailedError,
     CitationOutOfRangeError,
@@ -15,12 +20,14 @@ from horeb.errors import (
     InvalidReferenceError,
 )
 from horeb.markdown import extract_sections, render_analysis_md, render_similar_md
-from horeb.schemas import (
-    BookAnalysisResult,
-    PassageAnalysisResult,
-    SimilarityResult,
-    StudyGuideResult,
-)
+
+if TYPE_CHECKING:
+    from horeb.schemas import (
+        BookAnalysisResult,
+        PassageAnalysisResult,
+        SimilarityResult,
+        StudyGuideResult,
+    )
 
 # Exit codes — each HorebError subtype maps to a distinct code
 # so callers (scripts, CI) can distinguish failure modes.
@@ -29,6 +36,31 @@ EXIT_EMPTY_PASSAGE: int = 3
 EXIT_CITATION_OUT_OF_RANGE: int = 4
 EXIT_ANALYSIS_FAILED: int = 5
 
+
+# ---------------------------------------------------------------------------
+# Lazy engine entry points — horeb.engine pulls in pythonbible and pydantic,
+# so --help and argument errors never import it.
+# ---------------------------------------------------------------------------
+
+def analyze(
+    reference: str, batch: bool = False
+) -> "StudyGuideResult | PassageAnalysisResult | BookAnalysisResult":
+    """Run horeb.engine.analyze, importing the engine on first use."""
+    from horeb.engine import analyze as _analyze
+    if batch:
+        from horeb.llm import ClaudeProvider
+        return _analyze(reference, llm=ClaudeProvider(use_batch=True))
+    return _analyze(reference)
+
+
+def _find_similar(
+    reference: str, scope_book: str | None, top_n: int, tags: bool
+) -> "SimilarityResult":
+    """Run horeb.engine.find_similar, importing the engine on first use."""
+    from horeb.engine import find_similar
+    return find_similar(reference, scope_book=scope_book, top_n=top_n, tags=tags)
+
+
 app = typer.Typer(
     name="horeb",
     help="CLI-first AI engine for grounded Bible passage analysis.",
@@ -47,10 +79,15 @@ def analyze_cmd(
         None, "--output", help="Write result as Markdown to this file path (e.g. notes.md)",
         writable=True, resolve_path=True,
     ),
+    batch: bool = typer.Option(
+        False, "--batch",
+        help="Book analysis only: submit segments via the Message Batches API "
+             "(half the cost, but may take minutes to hours)",
+    ),
 ) -> None:
     """Analyse a Bible reference (passage, chapter, or whole book)."""
     try:
-        result = analyze(reference)
+        result = analyze(reference, batch=batch)
         if output is not None:
             _write_markdown(render_analysis_md(result, reference), output)
         else:
@@ -172,7 +209,7 @@ def _print_result(
         print(f"\n[NOTE] Low confidence fields: {fields}")
 
 
-def _print_similar_result(result: SimilarityResult) -> None:
+def _print_similar_result(result: "SimilarityResult") -> None:
     """Format and print a SimilarityResult to stdout."""
     if not result.candidates:
         print("No similar passages found.")
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import functools
+import json
+import os
 import re
 import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
+import json_repair
 import pythonbible as pb
 
 from horeb.bible_text import (
     Granularity,
     MAX_BOOK_LLM_CALLS,
     Segment,
+    _BOOK_DISPLAY_NAME,
+    _fast_parse,
     _get_verse_text,
     detect_granularity,
     retrieve_chapter,
@@ -26,20 +33,20 @@ from horeb.errors import (
 )
 from horeb.parallels import score_similarity
 from horeb.prompts import (
-    SYSTEM_PROMPT,
     build_passage_system_prompt,
     build_passage_user_prompt,
+    build_segment_batch_user_prompt,
     build_segment_system_prompt,
     build_segment_user_prompt,
     build_synthesis_system_prompt,
     build_synthesis_user_prompt,
     build_tag_system_prompt,
     build_tag_user_prompt,
-    build_user_prompt,
 )
 from horeb.repair import repair_and_validate
 from horeb.schemas import (
     AnalysisResult,
+    BatchSegmentResult,
     BookAnalysisResult,
     PassageAnalysisResult,
     PassageData,
@@ -53,11 +60,15 @@ from horeb.schemas import (
 )
 
 if TYPE_CHECKING:
-    from horeb.llm import LLMProvider
+    from pydantic import BaseModel
+
+    from horeb.llm import BatchLLMProvider, LLMProvider
 
 MIN_PASSAGE_CHARS: int = 20
 SEGMENT_FAILURE_THRESHOLD: float = 0.3   # abort book if >30% of segments fail
-_MAX_PARALLEL_WORKERS: int = 5            # concurrent segment LLM calls in book pipeline stage 1
+_MAX_PARALLEL_WORKERS: int = 5            # default concurrent segment LLM calls in stage 1
+_SEGMENTS_PER_CALL: int = 1               # default segments stacked into one stage 1 call
+_STACKED_TOKENS_PER_SEGMENT: int = 1024   # output budget per segment in a stacked call
 _SYNTHESIS_MAX_TOKENS: int = 6144         # output budget for synthesis (supports 60-section outlines)
 _MAX_TAG_CANDIDATES: int = 10             # hard cap on candidates sent to the 6A tagging LLM call
 
@@ -129,7 +140,7 @@ def verify_citations(
     result: AnalysisResult,
     passage: PassageData,
     mode: CitationMode = CitationMode.SINGLE_VERSE,
-    valid_refs: set[str] | None = None,
+    valid_refs: frozenset[str] | set[str] | None = None,
 ) -> None:
     """
     Verify every cited verse reference in result falls within the valid range.
@@ -139,12 +150,15 @@ def verify_citations(
         passage:    The source PassageData (used for SINGLE_VERSE mode).
         mode:       CitationMode controlling validation strategy.
         valid_refs: For SYNTHESIS mode — union of all segment-level citation
-                    strings. Citations not in this set are out-of-scope.
+                    strings (see build_valid_refs). Citations not in this set
+                    are out-of-scope.
 
     Raises:
         CitationOutOfRangeError: if any citation is outside the valid range.
     """
-    cited_refs = extract_verse_refs(result)
+    # Models often cite the same verse repeatedly; check each distinct ref once,
+    # in first-seen order so the reported failure is deterministic
+    cited_refs = dict.fromkeys(extract_verse_refs(result))
 
     if mode == CitationMode.SYNTHESIS:
         if valid_refs is None:
@@ -160,8 +174,48 @@ def verify_citations(
     # SINGLE_VERSE mode: check against passage start/end
     passage_start = (passage.start_chapter, passage.start_verse)
     passage_end = (passage.end_chapter, passage.end_verse)
+    book_name = _BOOK_DISPLAY_NAME[pb.Book(passage.book)]
     for ref_str in cited_refs:
-        _check_single_verse_citation(ref_str, passage, passage_start, passage_end)
+        _check_single_verse_citation(ref_str, passage, book_name, passage_start, passage_end)
+
+
+def build_valid_refs(segment_results: list[SegmentResult]) -> frozenset[str]:
+    """
+    Union of every citation in the validated segment results, for SYNTHESIS mode.
+
+    Build it once per book and pass the same frozenset to every verify_citations
+    call (including retries) rather than re-walking the segment citations.
+    """
+    return frozenset(ref for r in segment_results for ref in extract_verse_refs(r))
+
+
+def _study_guide_refs(result: StudyGuideResult) -> list[str]:
+    refs = [q.verse_reference for q in result.questions if q.verse_reference is not None]
+    if result.named_entities:
+        refs += [e.verse_reference for e in result.named_entities if e.verse_reference is not None]
+    return refs
+
+
+def _citation_refs(result: PassageAnalysisResult | SegmentResult) -> list[str]:
+    return [c.verse_reference for c in result.citations if c.verse_reference]
+
+
+def _outline_refs(result: BookAnalysisResult) -> list[str]:
+    return [
+        anchor
+        for section in result.outline
+        for anchor in (section.start_verse, section.end_verse)
+        if anchor
+    ]
+
+
+# One extractor per result type: a dict lookup instead of probing every field
+_VERSE_REF_EXTRACTORS: dict[type, Callable[[Any], list[str]]] = {
+    StudyGuideResult: _study_guide_refs,
+    PassageAnalysisResult: _citation_refs,
+    SegmentResult: _citation_refs,
+    BookAnalysisResult: _outline_refs,
+}
 
 
 def extract_verse_refs(result: AnalysisResult) -> list[str]:
@@ -172,62 +226,60 @@ def extract_verse_refs(result: AnalysisResult) -> list[str]:
     PassageAnalysisResult / SegmentResult (citations list),
     and BookAnalysisResult (outline section anchors).
     """
-    refs: list[str] = []
-
-    # StudyGuideResult — questions
-    if hasattr(result, "questions") and result.questions:
-        for q in result.questions:
-            if q.verse_reference is not None:
-                refs.append(q.verse_reference)
-
-    # StudyGuideResult — named_entities
-    if hasattr(result, "named_entities") and result.named_entities:
-        for entity in result.named_entities:
-            if entity.verse_reference is not None:
-                refs.append(entity.verse_reference)
-
-    # PassageAnalysisResult / SegmentResult — citations list
-    if hasattr(result, "citations") and result.citations:
-        for citation in result.citations:
-            if citation.verse_reference:
-                refs.append(citation.verse_reference)
-
-    # BookAnalysisResult — outline section anchors
-    if hasattr(result, "outline") and result.outline:
-        for section in result.outline:
-            if section.start_verse:
-                refs.append(section.start_verse)
-            if section.end_verse:
-                refs.append(section.end_verse)
+    extractor = _VERSE_REF_EXTRACTORS.get(type(result))
+    if extractor is None:
+        # Subclasses of a registered schema resolve through their MRO
+        extractor = next(
+            (
+                _VERSE_REF_EXTRACTORS[cls]
+                for cls in type(result).__mro__
+                if cls in _VERSE_REF_EXTRACTORS
+            ),
+            None,
+        )
+        if extractor is None:
+            return []
+    return extractor(result)
+
+
+# Book-less citation: "3:16" or "3:16-18"
+_SHORT_CITATION_RE = re.compile(r"^\s*\d+\s*:\s*\d+(?:\s*-\s*\d+)?\s*$")
 
-    return refs
+
+@functools.lru_cache(maxsize=4096)
+def _cached_references(reference: str) -> tuple[pb.NormalizedReference, ...]:
+    """pb.get_references, memoized — the same refs are re-cited across segments and retries."""
+    return tuple(pb.get_references(reference))
 
 
 def _check_single_verse_citation(
     ref_str: str,
     passage: PassageData,
+    book_name: str,
     passage_start: tuple[int, int],
     passage_end: tuple[int, int],
 ) -> None:
     """
     Parse a single citation string and verify it is within the passage range.
+    book_name is the passage's display name, resolved once by the caller.
     Raises CitationOutOfRangeError if out of range or unparseable.
     """
-    book_name = pb.Book(passage.book).title
-
     # Handle short "chapter:verse" format (e.g. "3:16")
-    if ref_str.count(":") == 1 and not ref_str[0].isalpha():
+    if _SHORT_CITATION_RE.match(ref_str):
         full_ref = f"{book_name} {ref_str}"
     else:
         full_ref = ref_str
 
+    # Citations are almost always canonical "Book C:V" — parse those without pythonbible
+    cited = _fast_parse(full_ref)
     try:
-        normalized = pb.get_references(full_ref)
-        if not normalized:
-            raise CitationOutOfRangeError(
-                f"Cited reference {ref_str!r} could not be parsed"
-            )
-        cited = normalized[0]
+        if cited is None:
+            normalized = _cached_references(full_ref)
+            if not normalized:
+                raise CitationOutOfRangeError(
+                    f"Cited reference {ref_str!r} could not be parsed"
+                )
+            cited = normalized[0]
     except CitationOutOfRangeError:
         raise
     except Exception as exc:
@@ -327,6 +379,73 @@ def verify_synthesis_grounding(
                     )
 
 
+# ---------------------------------------------------------------------------
+# Book pipeline — stage 1 concurrency
+# ---------------------------------------------------------------------------
+
+def _stage1_workers(segment_count: int) -> int:
+    """
+    Number of threads to use for stage 1 segment calls.
+
+    Defaults to _MAX_PARALLEL_WORKERS; set HOREB_MAX_WORKERS to raise it when
+    the API key's rate limit allows more in-flight requests. Never more threads
+    than segments, and always at least one.
+    """
+    try:
+        workers = int(os.environ.get("HOREB_MAX_WORKERS", _MAX_PARALLEL_WORKERS))
+    except ValueError:
+        workers = _MAX_PARALLEL_WORKERS
+    return max(1, min(workers, segment_count))
+
+
+class _CallBudget:
+    """
+    LLMProvider wrapper that enforces the stage 1 share of MAX_BOOK_LLM_CALLS.
+
+    Counts every complete() call it forwards, including ones that fail, and
+    refuses further calls with AnalysisFailedError once limit is reached — so
+    stacked, fallback and retry calls together can never exceed the ceiling.
+    Safe to share across the stage 1 worker threads.
+    """
+
+    __slots__ = ("_llm", "_limit", "_lock", "calls")
+
+    def __init__(self, llm: "LLMProvider", limit: int) -> None:
+        self._llm = llm
+        self._limit = limit
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def complete(
+        self,
+        system: str,
+        prompt: str,
+        schema: "type[BaseModel] | None" = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        with self._lock:
+            if self.calls >= self._limit:
+                raise AnalysisFailedError("MAX_BOOK_LLM_CALLS ceiling reached")
+            self.calls += 1
+        return self._llm.complete(
+            system=system, prompt=prompt, schema=schema, max_tokens=max_tokens
+        )
+
+
+def _segments_per_call() -> int:
+    """
+    Number of segments to stack into one stage 1 LLM call.
+
+    Defaults to _SEGMENTS_PER_CALL (one call per segment); set
+    HOREB_SEGMENTS_PER_CALL to amortise the system prompt over several segments.
+    """
+    try:
+        per_call = int(os.environ.get("HOREB_SEGMENTS_PER_CALL", _SEGMENTS_PER_CALL))
+    except ValueError:
+        per_call = _SEGMENTS_PER_CALL
+    return max(1, per_call)
+
+
 # ---------------------------------------------------------------------------
 # Book pipeline — segment worker (called concurrently from analyze_book stage 1)
 # ---------------------------------------------------------------------------
@@ -335,44 +454,46 @@ def _run_segment(
     seg: "Segment",
     llm: "LLMProvider",
     seg_system_prompt: str,
-) -> "tuple[SegmentResult | SegmentFailure, int]":
+    raw: str | None = None,
+) -> "SegmentResult | SegmentFailure":
     """
-    Analyze one book segment. Returns (result, llm_calls_made).
+    Analyze one book segment.
+
+    raw is the segment's response if it was already fetched through a batch or
+    stacked request; when None the segment's LLM call is made here. Calls are
+    counted (and capped) by the _CallBudget that analyze_book passes as llm.
 
     Always returns a value — exceptions are caught and converted to SegmentFailure.
     Stateless and safe to call from multiple threads concurrently.
     """
-    if len(seg.text.strip()) < MIN_PASSAGE_CHARS:
-        return (
-            SegmentFailure(
-                segment_index=seg.segment_index,
-                chapter_start=seg.start_chapter,
-                chapter_end=seg.end_chapter,
-                error="Segment text too short",
-            ),
-            0,
+    if seg.text_len_stripped < MIN_PASSAGE_CHARS:
+        return SegmentFailure(
+            segment_index=seg.segment_index,
+            chapter_start=seg.start_chapter,
+            chapter_end=seg.end_chapter,
+            error="Segment text too short",
         )
 
     user_prompt = build_segment_user_prompt(seg.text, seg.reference, seg.segment_index)
-    calls = 0
     try:
-        raw = llm.complete(
-            system=seg_system_prompt,
-            prompt=user_prompt,
-            schema=SegmentResult,
-        )
-        calls += 1
+        if raw is None:
+            raw = llm.complete(
+                system=seg_system_prompt,
+                prompt=user_prompt,
+                schema=SegmentResult,
+            )
 
-        seg_result, retry_calls = repair_and_validate(
+        seg_result, _ = repair_and_validate(
             raw=raw,
             schema=SegmentResult,
             llm=llm,
             system_prompt=seg_system_prompt,
             user_prompt=user_prompt,
         )
-        calls += retry_calls
 
-        seg_result = seg_result.model_copy(update={"segment_index": seg.segment_index})
+        # seg_result was just validated from this segment's response — nothing
+        # else holds it, so stamp the authoritative index in place
+        seg_result.segment_index = seg.segment_index
 
         seg_passage = PassageData(
             reference=seg.reference,
@@ -387,20 +508,118 @@ def _run_segment(
         )
         verify_citations(seg_result, seg_passage, mode=CitationMode.SINGLE_VERSE)
 
-        return seg_result, calls
+        return seg_result
 
     except Exception as exc:
-        return (
-            SegmentFailure(
-                segment_index=seg.segment_index,
-                chapter_start=seg.start_chapter,
-                chapter_end=seg.end_chapter,
-                error=str(exc),
-            ),
-            calls,
+        return SegmentFailure(
+            segment_index=seg.segment_index,
+            chapter_start=seg.start_chapter,
+            chapter_end=seg.end_chapter,
+            error=str(exc),
         )
 
 
+def _prefetch_segments_batch(
+    segs: "list[Segment]",
+    llm: "BatchLLMProvider",
+    seg_system_prompt: str,
+) -> tuple[dict[int, str], int]:
+    """
+    Submit every analyzable segment's stage 1 call as one provider batch.
+
+    Returns ({segment_index: raw response} for the requests that succeeded,
+    number of requests submitted). Every submitted request counts as an LLM
+    call, whether or not it succeeded. Segments missing from the result (too
+    short, failed in the batch, or the whole batch failed or timed out) are
+    handled by _run_segment as usual — with an individual call if the stage 1
+    budget left after the batch allows it.
+    """
+    from horeb.llm import BatchRequest
+
+    requests = [
+        BatchRequest(
+            custom_id=str(seg.segment_index),
+            system=seg_system_prompt,
+            prompt=build_segment_user_prompt(seg.text, seg.reference, seg.segment_index),
+            schema=SegmentResult,
+        )
+        for seg in segs
+        if seg.text_len_stripped >= MIN_PASSAGE_CHARS
+    ]
+    try:
+        raws = llm.complete_batch(requests)
+    except Exception as exc:
+        print(
+            f"[WARN] Batch failed ({exc}). Falling back to individual calls.",
+            file=sys.stderr,
+        )
+        return {}, len(requests)
+    return {int(custom_id): raw for custom_id, raw in raws.items()}, len(requests)
+
+
+def _run_stacked_segments(
+    segs: "list[Segment]",
+    llm: "LLMProvider",
+    seg_system_prompt: str,
+) -> dict[int, str]:
+    """
+    Analyze several segments in one LLM call.
+
+    Returns {segment_index: raw SegmentResult JSON} for every segment the
+    response covered. Items are not validated here — _run_segment repairs and
+    verifies each one exactly as it would a single-segment response. Segments
+    missing from the response (or the whole group, if the call fails) get an
+    individual call from _run_segment.
+    """
+    wanted = {seg.segment_index for seg in segs}
+    try:
+        raw = llm.complete(
+            system=seg_system_prompt,
+            prompt=build_segment_batch_user_prompt(segs),
+            schema=BatchSegmentResult,
+            max_tokens=_STACKED_TOKENS_PER_SEGMENT * len(segs),
+        )
+        items = json_repair.loads(raw).get("results", [])
+    except Exception as exc:
+        print(
+            f"[WARN] Stacked call for segments {sorted(wanted)} failed ({exc}). "
+            f"Falling back to individual calls.",
+            file=sys.stderr,
+        )
+        return {}
+
+    raws: dict[int, str] = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("segment_index") in wanted:
+            raws[item["segment_index"]] = json.dumps(item)
+    return raws
+
+
+def _prefetch_segments_stacked(
+    segs: "list[Segment]",
+    llm: "LLMProvider",
+    seg_system_prompt: str,
+    per_call: int,
+) -> dict[int, str]:
+    """
+    Fetch stage 1 responses per_call segments at a time (groups run concurrently).
+
+    Each group is one llm.complete() call, so the _CallBudget passed as llm
+    counts it whether it succeeds, fails or covers only part of the group.
+    """
+    analyzable = [seg for seg in segs if seg.text_len_stripped >= MIN_PASSAGE_CHARS]
+    groups = [analyzable[i:i + per_call] for i in range(0, len(analyzable), per_call)]
+    prefetched: dict[int, str] = {}
+    if not groups:
+        return prefetched
+    with ThreadPoolExecutor(max_workers=_stage1_workers(len(groups))) as executor:
+        for raws in executor.map(
+            lambda group: _run_stacked_segments(group, llm, seg_system_prompt), groups
+        ):
+            prefetched.update(raws)
+    return prefetched
+
+
 # ---------------------------------------------------------------------------
 # Book pipeline — two-stage analyze_book()
 # ---------------------------------------------------------------------------
@@ -428,7 +647,7 @@ def analyze_book(book_name: str, llm: "LLMProvider") -> BookAnalysisResult:
     """
     # Resolve book
     try:
-        refs = pb.get_references(book_name)
+        refs = _cached_references(book_name)
         if not refs:
             raise InvalidReferenceError(f"Could not find book: {book_name!r}")
         book = refs[0].book
@@ -442,7 +661,7 @@ def analyze_book(book_name: str, llm: "LLMProvider") -> BookAnalysisResult:
     total = len(segments)
 
     print(
-        f"[INFO] Analyzing {book.name.title()}: {total} segments, "
+        f"[INFO] Analyzing {_BOOK_DISPLAY_NAME[book]}: {total} segments, "
         f"up to {min(total * 2, MAX_BOOK_LLM_CALLS)} LLM calls.",
         file=sys.stderr,
     )
@@ -470,20 +689,45 @@ def analyze_book(book_name: str, llm: "LLMProvider") -> BookAnalysisResult:
             ))
     segs_to_process = segments[:max_processable]
 
+    # Stage 1 prefetch: batch-capable providers submit every first response at
+    # once; otherwise HOREB_SEGMENTS_PER_CALL > 1 stacks several segments per call
+    use_batch = getattr(llm, "supports_batch", False)
+    prefetched: dict[int, str] = {}
+    if use_batch:
+        prefetched, total_llm_calls = _prefetch_segments_batch(
+            segs_to_process, llm, seg_system_prompt
+        )
+
+    # Hard ceiling for every other stage 1 call: stacked, first, fallback and
+    # retry calls share what the batch left, less the 2 reserved for synthesis.
+    # Calls past it are refused and their segments recorded as failures.
+    stage1_llm = _CallBudget(llm, MAX_BOOK_LLM_CALLS - 2 - total_llm_calls)
+    if not use_batch and (per_call := _segments_per_call()) > 1:
+        prefetched = _prefetch_segments_stacked(
+            segs_to_process, stage1_llm, seg_system_prompt, per_call
+        )
+
     # Stage 1: per-segment analysis (parallelized — calls are I/O-bound and independent)
-    with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_WORKERS) as executor:
+    with ThreadPoolExecutor(max_workers=_stage1_workers(len(segs_to_process))) as executor:
         future_map = {
-            executor.submit(_run_segment, seg, llm, seg_system_prompt): seg
+            executor.submit(
+                _run_segment,
+                seg,
+                stage1_llm,
+                seg_system_prompt,
+                prefetched.get(seg.segment_index),
+            ): seg
             for seg in segs_to_process
         }
         for future in as_completed(future_map):
-            result, calls = future.result()
-            total_llm_calls += calls
+            result = future.result()
             if isinstance(result, SegmentResult):
                 segment_results.append(result)
             else:
                 segment_failures.append(result)
 
+    total_llm_calls += stage1_llm.calls
+
     # Restore deterministic ordering (as_completed yields in completion order)
     segment_results.sort(key=lambda r: r.segment_index)
 
@@ -507,21 +751,22 @@ def analyze_book(book_name: str, llm: "LLMProvider") -> BookAnalysisResult:
     # Stage 2: synthesis
     # Build cited verse text lookup — gives synthesis model direct text anchors
     verse_texts: dict[int, list[tuple[str, str]]] = {}
+    segment_by_index = {s.segment_index: s for s in segments}
     for seg_result in segment_results:
+        # One lookup per segment, not a scan of every segment per citation
+        orig_seg = segment_by_index.get(seg_result.segment_index)
+        if orig_seg is None:
+            continue
+        book_value = orig_seg.book.value
         seg_texts: list[tuple[str, str]] = []
         for citation in seg_result.citations:
-            if citation.verse_reference and ":" in citation.verse_reference:
+            ref = citation.verse_reference
+            if ref and ":" in ref:
                 try:
-                    ch_str, v_str = citation.verse_reference.split(":", 1)
-                    ch, v = int(ch_str), int(v_str)
-                    orig_seg = next(
-                        (s for s in segments if s.segment_index == seg_result.segment_index),
-                        None,
-                    )
-                    if orig_seg is not None:
-                        text = _get_verse_text(orig_seg.book.value, ch, v)
-                        if text:
-                            seg_texts.append((citation.verse_reference, text))
+                    ch_str, v_str = ref.split(":", 1)
+                    text = _get_verse_text(book_value, int(ch_str), int(v_str))
+                    if text:
+                        seg_texts.append((ref, text))
                 except (ValueError, AttributeError):
                     pass
         if seg_texts:
@@ -557,11 +802,15 @@ def analyze_book(book_name: str, llm: "LLMProvider") -> BookAnalysisResult:
     )
     total_llm_calls += retry_calls
 
+    print(
+        f"[INFO] {_BOOK_DISPLAY_NAME[book]}: {total_llm_calls} LLM calls made "
+        f"(MAX_BOOK_LLM_CALLS={MAX_BOOK_LLM_CALLS}).",
+        file=sys.stderr,
+    )
+
     # Stamp failed segment indices into result
     if segment_failures:
-        book_result = book_result.model_copy(
-            update={"failed_segments": [f.segment_index for f in segment_failures]}
-        )
+        book_result.failed_segments = [f.segment_index for f in segment_failures]
 
     # Verify synthesis grounding — source_segments + verse anchor range check
     verify_synthesis_grounding(book_result, segment_results, segments)
@@ -644,6 +893,62 @@ def analyze(
     return analyze_passage(passage, llm)
 
 
+def analyze_many(
+    references: list[str],
+    llm: "LLMProvider | None" = None,
+) -> list[StudyGuideResult | PassageAnalysisResult | BookAnalysisResult]:
+    """
+    Analyze several references, returning results in input order.
+
+    Passage and chapter references are independent single LLM round-trips, so
+    they run concurrently (same worker cap as book stage 1). Book references
+    run one after another — each already parallelises its own segments.
+
+    Every reference is resolved before any LLM call is made — passages and
+    chapters are retrieved and books segmented — so an unrecognised, over-long
+    or too-large reference fails fast.
+
+    Raises:
+        InvalidReferenceError: the first reference, in input order, that does
+            not resolve.
+        Otherwise the first error, in input order, from the passage and chapter
+        analyses, then the first from the book analyses (which run afterwards).
+    """
+    if llm is None:
+        from horeb.llm import ClaudeProvider
+        llm = ClaudeProvider()
+
+    passages: dict[int, PassageData] = {}
+    books: list[int] = []
+    for i, reference in enumerate(references):
+        ref, granularity = detect_granularity(reference)
+        if granularity == Granularity.BOOK:
+            segment_book(ref.book)  # memoised — analyze_book() reuses the segments
+            books.append(i)
+        elif granularity == Granularity.CHAPTER:
+            passages[i] = retrieve_chapter(ref.book, ref.start_chapter)
+        else:
+            passages[i] = retrieve_passage(reference)
+
+    results: list[StudyGuideResult | PassageAnalysisResult | BookAnalysisResult | None] = [
+        None
+    ] * len(references)
+
+    if passages:
+        with ThreadPoolExecutor(max_workers=_stage1_workers(len(passages))) as executor:
+            futures = {
+                i: executor.submit(analyze_passage, passage, llm)
+                for i, passage in passages.items()
+            }
+            for i, future in futures.items():
+                results[i] = future.result()
+
+    for i in books:
+        results[i] = analyze_book(references[i], llm)
+
+    return results
+
+
 # ---------------------------------------------------------------------------
 # find_similar — 6A evidence tagging helpers
 # ---------------------------------------------------------------------------
@@ -776,7 +1081,7 @@ def find_similar(
     scope_pb_book: pb.Book | None = None
     if scope_book is not None:
         try:
-            refs = pb.get_references(scope_book)
+            refs = _cached_references(scope_book)
             if not refs:
                 raise InvalidReferenceError(f"Could not find scope book: {scope_book!r}")
             scope_pb_book = refs[0].book
@@ -843,14 +1148,15 @@ def analyze_study_guide(reference: str, llm: "LLMProvider | None" = None) -> Stu
             f"({len(passage.text)} chars). Check the reference."
         )
 
-    user_prompt = build_user_prompt(passage)
-    raw_response = llm.complete(system=SYSTEM_PROMPT, prompt=user_prompt, schema=StudyGuideResult)
+    sys_prompt = build_passage_system_prompt()
+    user_prompt = build_passage_user_prompt(passage)
+    raw_response = llm.complete(system=sys_prompt, prompt=user_prompt, schema=StudyGuideResult)
 
     result, _ = repair_and_validate(
         raw=raw_response,
         schema=StudyGuideResult,
         llm=llm,
-        system_prompt=SYSTEM_PROMPT,
+        system_prompt=sys_prompt,
         user_prompt=user_prompt,
     )
 
@@ -1,16 +1,26 @@
+from __future__ import annotations
+
+import functools
+import hashlib
 import json
 import os
+import sqlite3
 import sys
-from typing import Protocol
-
-import anthropic
-from pydantic import BaseModel
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
 
 from horeb.errors import AnalysisFailedError
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 _MODEL = "claude-haiku-4-5-20251001"
 _DEFAULT_MAX_TOKENS = 2048
 _TOOL_SCHEMA_OVERHEAD: int = 200  # approximate additional tokens for injected tool schema JSON
+_BATCH_POLL_SECONDS: float = 10.0  # interval between Message Batch status checks
+_BATCH_MAX_WAIT_SECONDS: float = 3600.0  # give up on a Message Batch that has not ended by then
 
 
 class LLMProvider(Protocol):
@@ -35,6 +45,34 @@ class LLMProvider(Protocol):
         ...
 
 
+@dataclass
+class BatchRequest:
+    """One request in a complete_batch() submission, addressed by custom_id."""
+    custom_id: str
+    system: str
+    prompt: str
+    schema: type[BaseModel] | None = None
+    max_tokens: int | None = None
+
+
+class BatchLLMProvider(LLMProvider, Protocol):
+    """
+    Optional capability: an LLMProvider that can also submit many requests as
+    one asynchronous batch. Callers check supports_batch before using it.
+    """
+    supports_batch: bool
+
+    def complete_batch(self, requests: list[BatchRequest]) -> dict[str, str]:
+        """
+        Submit all requests as one batch and block until it has ended.
+
+        Returns {custom_id: raw response string} for requests that succeeded.
+        Failed requests are omitted — callers fall back to complete() for them.
+        """
+        ...
+
+
+@functools.lru_cache(maxsize=32)
 def _build_tool_for_schema(schema: type[BaseModel], tool_name: str = "submit_result") -> dict:
     """
     Build a Claude tool definition from any Pydantic model's JSON Schema.
@@ -43,6 +81,9 @@ def _build_tool_for_schema(schema: type[BaseModel], tool_name: str = "submit_res
     - Removes schema tokens from the user prompt
     - Claude's API enforces JSON structure at the transport level
     - Reduces repair/retry frequency for structural issues
+
+    Cached per schema class: model_json_schema() walks the whole model, and the
+    returned dict is only ever read (passed through as request params).
     """
     json_schema = schema.model_json_schema()
     json_schema.pop("title", None)  # avoid conflict with tool-level "name" field
@@ -53,6 +94,50 @@ def _build_tool_for_schema(schema: type[BaseModel], tool_name: str = "submit_res
     }
 
 
+class _ResponseCache:
+    """
+    Content-addressed on-disk cache of raw LLM responses (SQLite, stdlib only).
+
+    Keys are a blake2b digest of everything that determines the request: model,
+    max_tokens, system prompt, user prompt and the full tool definition, so a
+    schema change never serves a stale shape. Safe to share across the stage 1
+    worker threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, raw TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """Digest of the Messages API parameters for one request."""
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, raw: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, raw) VALUES (?, ?)", (key, raw)
+            )
+
+
+def _default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "horeb", "responses.sqlite3")
+
+
 class ClaudeProvider:
     """
     LLMProvider implementation backed by the Anthropic API.
@@ -61,12 +146,53 @@ class ClaudeProvider:
     across all calls — avoids re-reading env vars and re-allocating HTTP
     connection pools on every segment call.
 
+    With use_batch=True the provider also advertises supports_batch, and the
+    book pipeline submits stage 1 through the Message Batches API: half the
+    token cost, at the price of latency (batches may take minutes to hours).
+
     Set HOREB_DEBUG=1 to log estimated prompt token counts before each call.
+
+    Set HOREB_CACHE=1 to reuse responses for byte-identical requests from an
+    on-disk cache (~/.cache/horeb). Off by default: sampling is not
+    deterministic, and a cached response that fails validation would be served
+    again on every rerun until the cache is cleared.
     """
 
-    def __init__(self, max_tokens: int = _DEFAULT_MAX_TOKENS) -> None:
+    def __init__(self, max_tokens: int = _DEFAULT_MAX_TOKENS, use_batch: bool = False) -> None:
+        # Imported here: the SDK takes ~1 s to import cold, and nothing but a
+        # live provider needs it (BatchRequest, test doubles, offline commands)
+        import anthropic
+
         self._client = anthropic.Anthropic()
         self._default_max_tokens = max_tokens
+        self.supports_batch = use_batch
+        self._cache = (
+            _ResponseCache(_default_cache_path())
+            if os.environ.get("HOREB_CACHE") == "1"
+            else None
+        )
+
+    def _request_params(
+        self,
+        system: str,
+        prompt: str,
+        schema: type[BaseModel] | None,
+        max_tokens: int | None,
+    ) -> dict:
+        """Build Messages API parameters, forcing a tool call when schema is given."""
+        params: dict = dict(
+            model=_MODEL,
+            max_tokens=max_tokens if max_tokens is not None else self._default_max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        if schema is not None:
+            tool = _build_tool_for_schema(schema)
+            params["tools"] = [tool]
+            params["tool_choice"] = {"type": "any"}
+
+        return params
 
     def complete(
         self,
@@ -75,7 +201,7 @@ class ClaudeProvider:
         schema: type[BaseModel] | None = None,
         max_tokens: int | None = None,
     ) -> str:
-        tokens = max_tokens if max_tokens is not None else self._default_max_tokens
+        kwargs = self._request_params(system, prompt, schema, max_tokens)
 
         if os.environ.get("HOREB_DEBUG") == "1":
             total_chars = len(system) + len(prompt)
@@ -84,44 +210,109 @@ class ClaudeProvider:
             schema_note = f" + ~{schema_tokens} tool schema" if schema is not None else ""
             print(
                 f"[DEBUG] Prompt chars: {total_chars} (~{total_chars // 4} tokens"
-                f"{schema_note}) = ~{estimated_tokens} total, max_tokens: {tokens}",
+                f"{schema_note}) = ~{estimated_tokens} total, max_tokens: {kwargs['max_tokens']}",
                 file=sys.stderr,
             )
 
-        kwargs: dict = dict(
-            model=_MODEL,
-            max_tokens=tokens,
-            system=system,
-            messages=[{"role": "user", "content": prompt}],
+        cache_key = None
+        if self._cache is not None:
+            cache_key = _ResponseCache.key(kwargs)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        response = self._client.messages.create(**kwargs)
+        raw = _extract_output(response.content, schema)
+        if cache_key is not None:
+            self._cache.put(cache_key, raw)
+        return raw
+
+    def complete_batch(self, requests: list[BatchRequest]) -> dict[str, str]:
+        """
+        Submit requests as one Message Batch, poll until it ends, and return
+        {custom_id: raw response} for every request that succeeded.
+
+        Errored, expired and canceled requests are left out of the result so the
+        caller can retry them individually with complete().
+
+        Raises:
+            TimeoutError: if the batch has not ended within _BATCH_MAX_WAIT_SECONDS.
+                The batch is canceled first (best effort) so it stops billing.
+        """
+        if not requests:
+            return {}
+
+        schemas = {r.custom_id: r.schema for r in requests}
+        batch = self._client.messages.batches.create(requests=[
+            {
+                "custom_id": r.custom_id,
+                "params": self._request_params(r.system, r.prompt, r.schema, r.max_tokens),
+            }
+            for r in requests
+        ])
+        print(
+            f"[INFO] Submitted message batch {batch.id} ({len(requests)} requests); "
+            f"polling every {_BATCH_POLL_SECONDS:.0f}s.",
+            file=sys.stderr,
         )
 
-        if schema is not None:
-            tool = _build_tool_for_schema(schema)
-            kwargs["tools"] = [tool]
-            kwargs["tool_choice"] = {"type": "any"}
+        deadline = time.monotonic() + _BATCH_MAX_WAIT_SECONDS
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                try:
+                    self._client.messages.batches.cancel(batch.id)
+                except Exception:
+                    pass
+                raise TimeoutError(
+                    f"Message batch {batch.id} did not end within "
+                    f"{_BATCH_MAX_WAIT_SECONDS:.0f}s"
+                )
+            time.sleep(_BATCH_POLL_SECONDS)
+            batch = self._client.messages.batches.retrieve(batch.id)
 
-        response = self._client.messages.create(**kwargs)
+        raws: dict[str, str] = {}
+        for entry in self._client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                continue
+            try:
+                raws[entry.custom_id] = _extract_output(
+                    entry.result.message.content, schemas.get(entry.custom_id)
+                )
+            except AnalysisFailedError:
+                continue
+        return raws
 
-        # If a tool was forced, extract the tool call input
-        if schema is not None:
-            for block in response.content:
-                if block.type == "tool_use":
-                    # block.input is already a parsed dict; serialise to string
-                    # so LLMProvider.complete() always returns str (testable contract)
-                    return json.dumps(block.input)
-
-            # tool_choice="any" guarantees a tool call — this path should not be reached
-            raise AnalysisFailedError(
-                "LLM response contained no tool call",
-                raw_response=str(response.content),
-            )
 
-        # Plain text response (no tool)
-        for block in response.content:
-            if hasattr(block, "text"):
-                return block.text
+def _extract_output(content: list, schema: type[BaseModel] | None) -> str:
+    """
+    Return the raw string payload of a Messages API response.
+
+    With a schema, the forced tool call's input is serialised to JSON so
+    LLMProvider.complete() always returns str (testable contract); without one,
+    the first text block is returned.
 
+    Raises:
+        AnalysisFailedError: if the expected tool call or text block is missing.
+    """
+    # If a tool was forced, extract the tool call input
+    if schema is not None:
+        for block in content:
+            if block.type == "tool_use":
+                # block.input is already a parsed dict; serialise to string
+                return json.dumps(block.input)
+
+        # tool_choice="any" guarantees a tool call — this path should not be reached
         raise AnalysisFailedError(
-            "LLM response contained no text content",
-            raw_response=str(response.content),
+            "LLM response contained no tool call",
+            raw_response=str(content),
         )
+
+    # Plain text response (no tool)
+    for block in content:
+        if hasattr(block, "text"):
+            return block.text
+
+    raise AnalysisFailedError(
+        "LLM response contained no text content",
+        raw_response=str(content),
+    )
@@ -14,13 +14,21 @@ The score is deterministic: same seed + same scope always returns the same ranki
 from __future__ import annotations
 
 import functools
+import heapq
 import math
 import re
+from collections import Counter
+from itertools import chain
 from dataclasses import dataclass, field
 
 import pythonbible as pb
 
-from horeb.bible_text import _count_chapter_verses, _get_verse_text
+from horeb.bible_text import (
+    _BOOK_DISPLAY_NAME,
+    _NUM_CHAPTERS,
+    _count_chapter_verses,
+    _get_verse_text,
+)
 from horeb.schemas import PassageData
 
 # ---------------------------------------------------------------------------
@@ -52,7 +60,7 @@ DEFAULT_TOP_N: int = 10
 # Internal types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _VerseDoc:
     """A single verse represented as a term-frequency vector."""
     ref: str               # "chapter:verse" label
@@ -60,9 +68,24 @@ class _VerseDoc:
     chapter: int
     verse: int
     term_freqs: dict[str, float] = field(default_factory=dict)
+    # Filled once by _get_book_tfidf. The TF-IDF weights live only in the book's
+    # postings; each doc keeps just its distinct terms (for overlap ranking) and
+    # vector norm, and term_freqs is released.
+    terms: tuple[str, ...] = ()
+    norm: float = 0.0
 
 
 @dataclass
+class _BookIndex:
+    """Cached TF-IDF index for one book (built once by _get_book_tfidf)."""
+    corpus: list[_VerseDoc]
+    idf: dict[str, float]
+    # Inverted index: term → [(corpus position, TF-IDF weight)] for every verse
+    # containing it. Scoring walks only the postings of the seed's terms.
+    postings: dict[str, list[tuple[int, float]]]
+
+
+@dataclass(slots=True)
 class CandidateMatch:
     """One candidate similar passage returned by score_similarity."""
     reference: str          # e.g. "John 3:16"
@@ -75,9 +98,12 @@ class CandidateMatch:
 # Tokenisation
 # ---------------------------------------------------------------------------
 
+_NON_ALPHA_RE = re.compile(r"[^a-z\s]")
+
+
 def _tokenise(text: str) -> list[str]:
     """Lowercase, strip punctuation, remove stopwords and short tokens."""
-    raw = re.sub(r"[^a-z\s]", "", text.lower()).split()
+    raw = _NON_ALPHA_RE.sub("", text.lower()).split()
     return [t for t in raw if len(t) >= _MIN_TOKEN_LEN and t not in _STOPWORDS]
 
 
@@ -85,11 +111,8 @@ def _term_freq(tokens: list[str]) -> dict[str, float]:
     """Compute normalised term frequency."""
     if not tokens:
         return {}
-    counts: dict[str, int] = {}
-    for t in tokens:
-        counts[t] = counts.get(t, 0) + 1
     total = len(tokens)
-    return {t: c / total for t, c in counts.items()}
+    return {t: c / total for t, c in Counter(tokens).items()}
 
 
 # ---------------------------------------------------------------------------
@@ -98,7 +121,7 @@ def _term_freq(tokens: list[str]) -> dict[str, float]:
 
 def _build_corpus(book: pb.Book) -> list[_VerseDoc]:
     """Build a TF-IDF corpus of all verses in the given book."""
-    num_chapters = pb.get_number_of_chapters(book)
+    num_chapters = _NUM_CHAPTERS[book.value]
     docs: list[_VerseDoc] = []
     for chapter in range(1, num_chapters + 1):
         num_verses = _count_chapter_verses(book, chapter)
@@ -122,10 +145,7 @@ def _compute_idf(corpus: list[_VerseDoc]) -> dict[str, float]:
     n = len(corpus)
     if n == 0:
         return {}
-    df: dict[str, int] = {}
-    for doc in corpus:
-        for term in doc.term_freqs:
-            df[term] = df.get(term, 0) + 1
+    df = Counter(chain.from_iterable(doc.term_freqs for doc in corpus))
     return {term: math.log(n / count) for term, count in df.items()}
 
 
@@ -141,28 +161,20 @@ def _tfidf_vector(doc: _VerseDoc, idf: dict[str, float]) -> dict[str, float]:
     }
 
 
-def _cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
-    """Cosine similarity between two sparse TF-IDF vectors."""
-    common = set(vec_a) & set(vec_b)
-    if not common:
-        return 0.0
-    dot = sum(vec_a[t] * vec_b[t] for t in common)
-    norm_a = math.sqrt(sum(v * v for v in vec_a.values()))
-    norm_b = math.sqrt(sum(v * v for v in vec_b.values()))
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _l2_norm(vec: dict[str, float]) -> float:
+    """Euclidean length of a sparse vector."""
+    return math.sqrt(sum(v * v for v in vec.values()))
 
 
 def _ranked_overlap_terms(
     seed_vec: dict[str, float],
-    candidate_vec: dict[str, float],
+    candidate_terms: tuple[str, ...],
     idf: dict[str, float],
     top_n: int = 5,
 ) -> list[str]:
-    """Return overlapping terms sorted by IDF weight descending."""
-    common = set(seed_vec) & set(candidate_vec)
-    ranked = sorted(common, key=lambda t: idf.get(t, 0.0), reverse=True)
+    """Return overlapping terms sorted by IDF weight descending (ties alphabetical)."""
+    common = [t for t in candidate_terms if t in seed_vec]
+    ranked = sorted(common, key=lambda t: (-idf.get(t, 0.0), t))
     return ranked[:top_n]
 
 
@@ -170,18 +182,28 @@ def _ranked_overlap_terms(
 # Public API
 # ---------------------------------------------------------------------------
 
-@functools.lru_cache(maxsize=None)
-def _get_book_tfidf(book: pb.Book) -> tuple[list[_VerseDoc], dict[str, float]]:
+@functools.lru_cache(maxsize=len(pb.Book))
+def _get_book_tfidf(book: pb.Book) -> _BookIndex:
     """
-    Build and cache the TF-IDF corpus and IDF table for the given book.
+    Build and cache the TF-IDF index for the given book.
 
     lru_cache eliminates repeated tokenisation and IDF computation across
     multiple find_similar calls on the same book (common in library/REPL use).
-    The corpus and IDF table are read-only after construction, so caching is safe.
+    The term → verse postings and each doc's L2 norm are computed here too, so
+    scoring never rebuilds a vector. The index is read-only after construction,
+    so caching is safe.
     """
     corpus = _build_corpus(book)
     idf = _compute_idf(corpus)
-    return corpus, idf
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for i, doc in enumerate(corpus):
+        vec = _tfidf_vector(doc, idf)
+        doc.norm = _l2_norm(vec)
+        doc.terms = tuple(vec)
+        doc.term_freqs = {}
+        for term, weight in vec.items():
+            postings.setdefault(term, []).append((i, weight))
+    return _BookIndex(corpus=corpus, idf=idf, postings=postings)
 
 
 def score_similarity(
@@ -200,12 +222,14 @@ def score_similarity(
 
     Returns:
         List of CandidateMatch sorted by similarity_score descending.
-        Does not include verses that overlap with the seed passage itself.
+        Does not include verses that overlap with the seed passage itself
+        (when scope_book is the seed's own book).
     """
     book = scope_book if scope_book is not None else pb.Book(seed.book)
-    book_name = book.name.replace("_", " ").title()
+    book_name = _BOOK_DISPLAY_NAME[book]
 
-    corpus, idf = _get_book_tfidf(book)
+    index = _get_book_tfidf(book)
+    corpus, idf = index.corpus, index.idf
     if not corpus:
         return []
 
@@ -214,38 +238,48 @@ def score_similarity(
     seed_tf = _term_freq(seed_tokens)
     seed_vec = {term: tf * idf.get(term, 0.0) for term, tf in seed_tf.items()}
 
-    if not seed_vec:
+    seed_norm = _l2_norm(seed_vec)
+    if seed_norm == 0.0:
         return []
 
-    # Determine seed verse ID range to exclude from candidates
-    seed_verse_ids: set[tuple[int, int]] = {
-        (ch, v)
-        for ch in range(seed.start_chapter, seed.end_chapter + 1)
-        for v in range(
-            seed.start_verse if ch == seed.start_chapter else 1,
-            (seed.end_verse if ch == seed.end_chapter else _count_chapter_verses(book, ch)) + 1,
+    # Seed verses to exclude from candidates — only meaningful when scoring the
+    # seed's own book; a (chapter, verse) in another scope book is unrelated
+    excluded: frozenset[tuple[int, int]] = frozenset()
+    if book.value == seed.book:
+        excluded = frozenset(
+            (ch, v)
+            for ch in range(seed.start_chapter, seed.end_chapter + 1)
+            for v in range(
+                seed.start_verse if ch == seed.start_chapter else 1,
+                (seed.end_verse if ch == seed.end_chapter else _count_chapter_verses(book, ch)) + 1,
+            )
         )
-    }
 
-    scored: list[tuple[float, _VerseDoc, list[str]]] = []
+    # Sparse dot products via the inverted index: only verses sharing at least
+    # one weighted term with the seed are ever touched
+    dots: dict[int, float] = {}
+    for term, seed_weight in seed_vec.items():
+        if seed_weight == 0.0:
+            continue
+        for i, doc_weight in index.postings.get(term, ()):
+            dots[i] = dots.get(i, 0.0) + seed_weight * doc_weight
 
-    for doc in corpus:
+    scored: list[tuple[float, _VerseDoc]] = []
+    for i, dot in dots.items():
+        doc = corpus[i]
         # Skip seed verses
-        if (doc.chapter, doc.verse) in seed_verse_ids:
+        if (doc.chapter, doc.verse) in excluded:
             continue
-
-        candidate_vec = _tfidf_vector(doc, idf)
-        score = _cosine_similarity(seed_vec, candidate_vec)
-
+        score = dot / (seed_norm * doc.norm)
         if score > 0.0:
-            overlap = _ranked_overlap_terms(seed_vec, candidate_vec, idf)
-            scored.append((score, doc, overlap))
+            scored.append((score, doc))
 
-    # Sort by score descending, deterministic tie-break by ref
-    scored.sort(key=lambda x: (-x[0], x[1].ref))
+    # Top-N by score descending, deterministic tie-break by ref
+    top = heapq.nsmallest(top_n, scored, key=lambda x: (-x[0], x[1].ref))
 
     results: list[CandidateMatch] = []
-    for score, doc, overlap in scored[:top_n]:
+    for score, doc in top:
+        overlap = _ranked_overlap_terms(seed_vec, doc.terms, idf)
         text = _get_verse_text(doc.book_value, doc.chapter, doc.verse) or ""
         labelled = f"[{doc.chapter}:{doc.verse}] {text}"
         full_ref = f"{book_name} {doc.chapter}:{doc.verse}"
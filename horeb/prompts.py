@@ -10,6 +10,7 @@ Structure:
 
   build_segment_system_prompt()             → str
   build_segment_user_prompt(text, ref, idx) → str   (book pipeline stage 1)
+  build_segment_batch_user_prompt(segs)     → str   (stage 1, several segments per call)
 
   build_synthesis_system_prompt()                            → str
   build_synthesis_user_prompt(segments, failed_segments)    → str   (book pipeline stage 2)
@@ -19,16 +20,13 @@ Structure:
 
   build_tag_system_prompt()                                 → str
   build_tag_user_prompt(seed_text, seed_ref, candidates)   → str   (find_similar --tags / 6A)
-
-  # Phase 1 backward-compat aliases (used by engine.py until Task 8 routing lands)
-  SYSTEM_PROMPT     = build_passage_system_prompt()  (module-level constant)
-  build_user_prompt = build_passage_user_prompt      (function alias)
 """
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from horeb.bible_text import Segment
     from horeb.schemas import PassageData, SegmentFailure, SegmentResult
 
 
@@ -69,20 +67,23 @@ _TOOL_INSTRUCTION: str = (
 # Passage / chapter analyze
 # ---------------------------------------------------------------------------
 
+_PASSAGE_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a Bible passage analysis engine with strict grounding requirements.",
+    _GROUNDING_PREAMBLE,
+    _CITATION_RULES,
+    _REFUSAL_INSTRUCTION,
+    "OUTPUT RULES:\n"
+    "- Provide exactly 3 summary bullet points — no more, no fewer.\n"
+    "- Each summary point must be grounded in a specific statement from the passage.\n"
+    "- Provide up to 5 key themes drawn only from the passage text.\n"
+    "- Provide verse-level citations only for verses that appear in the PASSAGE section.",
+    _TOOL_INSTRUCTION,
+])
+
+
 def build_passage_system_prompt() -> str:
     """System prompt for passage-level and chapter-level analyze."""
-    return "\n\n".join([
-        "You are a Bible passage analysis engine with strict grounding requirements.",
-        _GROUNDING_PREAMBLE,
-        _CITATION_RULES,
-        _REFUSAL_INSTRUCTION,
-        "OUTPUT RULES:\n"
-        "- Provide exactly 3 summary bullet points — no more, no fewer.\n"
-        "- Each summary point must be grounded in a specific statement from the passage.\n"
-        "- Provide up to 5 key themes drawn only from the passage text.\n"
-        "- Provide verse-level citations only for verses that appear in the PASSAGE section.",
-        _TOOL_INSTRUCTION,
-    ])
+    return _PASSAGE_SYSTEM_PROMPT
 
 
 def build_passage_user_prompt(passage: "PassageData") -> str:
@@ -92,57 +93,93 @@ def build_passage_user_prompt(passage: "PassageData") -> str:
     Context sections are labelled explicitly and excluded from analysis and
     citation to prevent the model from citing out-of-range verses.
     """
-    parts: list[str] = []
-
-    if passage.context_before is not None:
-        parts.append("CONTEXT (preceding verses — do not analyse or cite these):")
-        parts.append(passage.context_before)
-        parts.append("")
-
-    parts.append(f"PASSAGE ({passage.reference}):")
-    parts.append(passage.text)
-
-    if passage.context_after is not None:
-        parts.append("")
-        parts.append("CONTEXT (following verses — do not analyse or cite these):")
-        parts.append(passage.context_after)
-
-    return "\n".join(parts)
+    before = (
+        f"CONTEXT (preceding verses — do not analyse or cite these):\n{passage.context_before}\n\n"
+        if passage.context_before is not None
+        else ""
+    )
+    after = (
+        f"\n\nCONTEXT (following verses — do not analyse or cite these):\n{passage.context_after}"
+        if passage.context_after is not None
+        else ""
+    )
+    return f"{before}PASSAGE ({passage.reference}):\n{passage.text}{after}"
 
 
 # ---------------------------------------------------------------------------
 # Book pipeline — stage 1: per-segment analysis
 # ---------------------------------------------------------------------------
 
+_SEGMENT_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a Bible book analysis engine processing one segment of a larger book.",
+    _GROUNDING_PREAMBLE,
+    _CITATION_RULES,
+    _REFUSAL_INSTRUCTION,
+    "OUTPUT RULES:\n"
+    "- Provide exactly 3 summary bullet points for this segment only.\n"
+    "- Provide an outline_label: a short title for this segment (≤8 words).\n"
+    "- Provide up to 3 key themes from this segment's text only.\n"
+    "- Provide up to 5 verse citations from this segment only.\n"
+    "- Do not reference content from other chapters or the book as a whole.",
+    _TOOL_INSTRUCTION,
+])
+
+
 def build_segment_system_prompt() -> str:
     """System prompt for a single book segment (one chapter or verse window)."""
-    return "\n\n".join([
-        "You are a Bible book analysis engine processing one segment of a larger book.",
-        _GROUNDING_PREAMBLE,
-        _CITATION_RULES,
-        _REFUSAL_INSTRUCTION,
-        "OUTPUT RULES:\n"
-        "- Provide exactly 3 summary bullet points for this segment only.\n"
-        "- Provide an outline_label: a short title for this segment (≤8 words).\n"
-        "- Provide up to 3 key themes from this segment's text only.\n"
-        "- Provide up to 5 verse citations from this segment only.\n"
-        "- Do not reference content from other chapters or the book as a whole.",
-        _TOOL_INSTRUCTION,
-    ])
+    return _SEGMENT_SYSTEM_PROMPT
 
 
 def build_segment_user_prompt(text: str, reference: str, segment_index: int) -> str:
     """Build the user prompt for a single book segment."""
-    return "\n".join([
-        f"SEGMENT {segment_index} ({reference}):",
-        text,
-    ])
+    return f"SEGMENT {segment_index} ({reference}):\n{text}"
+
+
+def build_segment_batch_user_prompt(segs: "list[Segment]") -> str:
+    """
+    Build the user prompt for several book segments analysed in one call.
+
+    Each segment keeps the single-segment layout; the model is asked for one
+    results entry per segment, keyed by segment_index.
+    """
+    parts = [
+        f"The following {len(segs)} segments are independent. Analyse each one "
+        "separately, applying every rule above to that segment alone. Return one "
+        "entry in results per segment, with segment_index set to the segment number.",
+    ]
+    for seg in segs:
+        parts.append("")
+        parts.append(build_segment_user_prompt(seg.text, seg.reference, seg.segment_index))
+    return "\n".join(parts)
 
 
 # ---------------------------------------------------------------------------
 # Book pipeline — stage 2: synthesis
 # ---------------------------------------------------------------------------
 
+_SYNTHESIS_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a Bible book synthesis engine. Your input is a set of validated "
+    "segment analyses produced in an earlier stage.",
+    "SYNTHESIS GROUNDING RULES:\n"
+    "- You may ONLY reorganize, combine, and label information from the numbered "
+    "segment summaries and themes below.\n"
+    "- Do NOT add interpretations, connections, or conclusions not explicitly stated "
+    "in the segment summaries or themes.\n"
+    "- Do NOT speculate about segments marked as FAILED.\n"
+    "- Every outline section must declare the source_segments it draws from "
+    "(use the segment index numbers provided).\n"
+    "- An outline section with no valid source_segments is not permitted.",
+    _REFUSAL_INSTRUCTION,
+    "OUTPUT RULES:\n"
+    "- Produce a book outline: each section has a title, start_verse, end_verse, "
+    "and source_segments list.\n"
+    "- Produce exactly 3 book-level summary bullet points drawn only from segment summaries.\n"
+    "- Produce up to 5 book-level themes drawn only from segment themes.\n"
+    "- Use the verse anchor format \"chapter:verse\" (e.g. \"1:1\").",
+    _TOOL_INSTRUCTION,
+])
+
+
 def build_synthesis_system_prompt() -> str:
     """
     System prompt for book-level synthesis.
@@ -150,27 +187,7 @@ def build_synthesis_system_prompt() -> str:
     Strictly limits the model to reorganising and labelling validated segment
     outputs — it must not introduce claims beyond what the segments contain.
     """
-    return "\n\n".join([
-        "You are a Bible book synthesis engine. Your input is a set of validated "
-        "segment analyses produced in an earlier stage.",
-        "SYNTHESIS GROUNDING RULES:\n"
-        "- You may ONLY reorganize, combine, and label information from the numbered "
-        "segment summaries and themes below.\n"
-        "- Do NOT add interpretations, connections, or conclusions not explicitly stated "
-        "in the segment summaries or themes.\n"
-        "- Do NOT speculate about segments marked as FAILED.\n"
-        "- Every outline section must declare the source_segments it draws from "
-        "(use the segment index numbers provided).\n"
-        "- An outline section with no valid source_segments is not permitted.",
-        _REFUSAL_INSTRUCTION,
-        "OUTPUT RULES:\n"
-        "- Produce a book outline: each section has a title, start_verse, end_verse, "
-        "and source_segments list.\n"
-        "- Produce exactly 3 book-level summary bullet points drawn only from segment summaries.\n"
-        "- Produce up to 5 book-level themes drawn only from segment themes.\n"
-        "- Use the verse anchor format \"chapter:verse\" (e.g. \"1:1\").",
-        _TOOL_INSTRUCTION,
-    ])
+    return _SYNTHESIS_SYSTEM_PROMPT
 
 
 def build_synthesis_user_prompt(
@@ -192,70 +209,71 @@ def build_synthesis_user_prompt(
                          verses is appended to its block, giving the synthesis model a
                          direct text anchor rather than summaries alone.
     """
-    # Build a lookup so we can interleave failures in index order
+    # Index lookups so successes and failures interleave in index order
+    seg_by_index: dict[int, "SegmentResult"] = {s.segment_index: s for s in segments}
     failed_by_index: dict[int, "SegmentFailure"] = {f.segment_index: f for f in failed_segments}
-    all_indices = sorted(
-        {s.segment_index for s in segments} | set(failed_by_index.keys())
-    )
+    all_indices = sorted(seg_by_index.keys() | failed_by_index.keys())
 
-    parts: list[str] = ["SEGMENT ANALYSES (use only this information for synthesis):"]
+    # One flat list of lines, joined once — no per-segment block strings
+    lines: list[str] = ["SEGMENT ANALYSES (use only this information for synthesis):"]
 
     for idx in all_indices:
+        lines.append("")
         if idx in failed_by_index:
             f = failed_by_index[idx]
-            parts.append(
-                f"\n[Segment {idx}: Chapters {f.chapter_start}–{f.chapter_end} "
+            lines.append(
+                f"[Segment {idx}: Chapters {f.chapter_start}–{f.chapter_end} "
                 f"— ANALYSIS FAILED, content unavailable. "
                 f"Do not speculate about or fill in this segment.]"
             )
-        else:
-            seg = next(s for s in segments if s.segment_index == idx)
-            themes_str = ", ".join(seg.key_themes) if seg.key_themes else "(none)"
-            citations_str = (
-                ", ".join(c.verse_reference for c in seg.citations)
-                if seg.citations else "(none)"
-            )
-            summary_str = "\n  ".join(f"- {s}" for s in seg.summary)
-            seg_block = (
-                f"\n[Segment {idx}: {seg.outline_label}]\n"
-                f"Summary:\n  {summary_str}\n"
-                f"Themes: {themes_str}\n"
-                f"Citations: {citations_str}"
-            )
-            if verse_texts and idx in verse_texts:
-                verse_lines = "\n  ".join(
-                    f"[{ref}] {text}" for ref, text in verse_texts[idx]
-                )
-                seg_block += f"\nCited verse texts:\n  {verse_lines}"
-            parts.append(seg_block)
-
-    return "\n".join(parts)
+            continue
+
+        seg = seg_by_index[idx]
+        themes, citations = seg.key_themes, seg.citations
+        themes_str = ", ".join(themes) if themes else "(none)"
+        citations_str = (
+            ", ".join([c.verse_reference for c in citations])
+            if citations else "(none)"
+        )
+        lines.append(f"[Segment {idx}: {seg.outline_label}]")
+        lines.append("Summary:")
+        lines.extend([f"  - {s}" for s in seg.summary])
+        lines.append(f"Themes: {themes_str}")
+        lines.append(f"Citations: {citations_str}")
+        if verse_texts and idx in verse_texts:
+            lines.append("Cited verse texts:")
+            lines.extend([f"  [{ref}] {text}" for ref, text in verse_texts[idx]])
+
+    return "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
 # find_similar
 # ---------------------------------------------------------------------------
 
+_SIMILARITY_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a Bible passage similarity engine. "
+    "You have been given a seed passage and a list of candidate similar passages.",
+    "SIMILARITY GROUNDING RULES:\n"
+    "- For each candidate, you must quote the EXACT text from the seed passage "
+    "that overlaps with the candidate (verbatim_seed_quote).\n"
+    "- You must quote the EXACT text from the candidate passage that overlaps "
+    "with the seed (verbatim_candidate_quote).\n"
+    "- Both quotes must be a SINGLE CONTIGUOUS span of text exactly as it appears "
+    "in the provided passage — do NOT splice, join, or combine fragments from "
+    "different parts of the text.\n"
+    "- Both quotes must appear word-for-word in the texts provided to you.\n"
+    "- Do NOT assert theological parallels, interpretive connections, or thematic "
+    "similarities that are not evidenced by shared vocabulary in the provided texts.\n"
+    "- Do NOT invent passages or references not in the candidate list.",
+    _REFUSAL_INSTRUCTION,
+    _TOOL_INSTRUCTION,
+])
+
+
 def build_similarity_system_prompt() -> str:
     """System prompt for find_similar overlap explanation."""
-    return "\n\n".join([
-        "You are a Bible passage similarity engine. "
-        "You have been given a seed passage and a list of candidate similar passages.",
-        "SIMILARITY GROUNDING RULES:\n"
-        "- For each candidate, you must quote the EXACT text from the seed passage "
-        "that overlaps with the candidate (verbatim_seed_quote).\n"
-        "- You must quote the EXACT text from the candidate passage that overlaps "
-        "with the seed (verbatim_candidate_quote).\n"
-        "- Both quotes must be a SINGLE CONTIGUOUS span of text exactly as it appears "
-        "in the provided passage — do NOT splice, join, or combine fragments from "
-        "different parts of the text.\n"
-        "- Both quotes must appear word-for-word in the texts provided to you.\n"
-        "- Do NOT assert theological parallels, interpretive connections, or thematic "
-        "similarities that are not evidenced by shared vocabulary in the provided texts.\n"
-        "- Do NOT invent passages or references not in the candidate list.",
-        _REFUSAL_INSTRUCTION,
-        _TOOL_INSTRUCTION,
-    ])
+    return _SIMILARITY_SYSTEM_PROMPT
 
 
 def build_similarity_user_prompt(
@@ -312,15 +330,18 @@ EVIDENCE TAG RULES:
 """
 
 
+_TAG_SYSTEM_PROMPT: str = "\n\n".join([
+    "You are a textual evidence classifier for Bible passage similarity results. "
+    "Your only role is to classify vocabulary overlap between passages.",
+    _EVIDENCE_TAG_RULES,
+    _REFUSAL_INSTRUCTION,
+    _TOOL_INSTRUCTION,
+])
+
+
 def build_tag_system_prompt() -> str:
     """System prompt for the 6A evidence-tagging call."""
-    return "\n\n".join([
-        "You are a textual evidence classifier for Bible passage similarity results. "
-        "Your only role is to classify vocabulary overlap between passages.",
-        _EVIDENCE_TAG_RULES,
-        _REFUSAL_INSTRUCTION,
-        _TOOL_INSTRUCTION,
-    ])
+    return _TAG_SYSTEM_PROMPT
 
 
 def build_tag_user_prompt(
@@ -356,11 +377,3 @@ def build_tag_user_prompt(
 
     return "\n".join(parts)
 
-
-# ---------------------------------------------------------------------------
-# Phase 1 backward-compat aliases
-# Engine.py uses these until Task 8 routing lands.
-# ---------------------------------------------------------------------------
-
-SYSTEM_PROMPT: str = build_passage_system_prompt()
-build_user_prompt = build_passage_user_prompt
@@ -1,8 +1,8 @@
 """
 Two-stage JSON repair with a single LLM retry.
 
-Stage 1: json.loads() → Pydantic validation
-Stage 2: json_repair.repair() → Pydantic validation
+Stage 1: Pydantic JSON validation (model_validate_json)
+Stage 2: json_repair.repair_json() → Pydantic validation
 Stage 3: LLM retry with targeted correction message → Pydantic validation
 Hard ceiling: 2 total LLM calls. Never more.
 
@@ -13,7 +13,6 @@ repair_and_validate[T] is generic: pass any Pydantic BaseModel subclass as
 the schema argument. The caller is responsible for passing the correct
 system_prompt for the retry call.
 """
-import json
 import sys
 from typing import TYPE_CHECKING, TypeVar
 
@@ -53,23 +52,27 @@ def repair_and_validate(
     Raises:
         AnalysisFailedError: if all stages fail, with raw_response preserved.
     """
-    # Stage 1: direct parse + validate
-    result = _try_parse(raw, schema)
+    # Stage 1: direct parse + validate. The error is kept so the retry prompt
+    # can describe it without parsing raw a second time.
+    result, stage1_error = _parse(raw, schema)
     if result is not None:
         return result, 0
 
-    # Stage 2: structural JSON repair + validate
-    try:
-        repaired = json_repair.repair(raw)
-        result = _try_parse(repaired, schema)
-        if result is not None:
-            return result, 0
-    except Exception:
-        # json_repair can raise on extreme inputs — treat as repair failure
-        pass
+    # Stage 2: structural JSON repair + validate. Output with no object or
+    # array opener (empty, or a prose refusal) cannot repair into a model —
+    # skip the json_repair scan and go straight to the retry.
+    if "{" in raw or "[" in raw:
+        try:
+            repaired = json_repair.repair_json(raw)
+            result = _try_parse(repaired, schema)
+            if result is not None:
+                return result, 0
+        except Exception:
+            # json_repair can raise on extreme inputs — treat as repair failure
+            pass
 
     # Stage 3: one LLM retry with a targeted correction prompt
-    failure_reason = _get_failure_reason(raw, schema)
+    failure_reason = _describe_failure(stage1_error)
     print(
         f"[WARN] LLM retry triggered for {schema.__name__}. Reason: {failure_reason}",
         file=sys.stderr,
@@ -97,35 +100,39 @@ def repair_and_validate(
     )
 
 
-def _try_parse(raw: str, schema: type[T]) -> T | None:
+def _parse(raw: str, schema: type[T]) -> tuple[T | None, ValidationError | None]:
     """
-    Attempt json.loads + Pydantic validation against schema. Returns None on any failure.
-    Never raises.
+    Attempt Pydantic JSON validation against schema.
+
+    Returns (instance, None) on success and (None, error) when raw is not valid
+    JSON or does not match schema — pydantic-core reports both as a
+    ValidationError. Anything else (a bug in a validator) propagates.
+    model_validate_json parses and validates in one pass inside pydantic-core,
+    without building an intermediate dict through json.loads.
     """
     try:
-        data = json.loads(raw)
-        return schema.model_validate(data)
-    except Exception:
-        return None
+        return schema.model_validate_json(raw), None
+    except ValidationError as exc:
+        return None, exc
+
 
+def _try_parse(raw: str, schema: type[T]) -> T | None:
+    """Attempt Pydantic JSON validation against schema. Returns None on failure."""
+    return _parse(raw, schema)[0]
 
-def _get_failure_reason(raw: str, schema: type[BaseModel]) -> str:
+
+def _describe_failure(error: ValidationError | None) -> str:
     """
-    Parse the raw string to produce a human-readable failure reason.
+    Human-readable reason for a failed _parse, from the error it returned.
     Used to construct a targeted correction prompt for the LLM retry.
     """
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        return f"Invalid JSON: {exc}"
-
-    try:
-        schema.model_validate(data)
+    if error is None:
         return "Unknown validation error"
-    except ValidationError as exc:
-        errors = exc.errors()
-        if errors:
-            first = errors[0]
-            loc = " -> ".join(str(p) for p in first["loc"])
-            return f"Validation error on '{loc}': {first['msg']}"
+    errors = error.errors()
+    if not errors:
         return "Pydantic validation failed with no details"
+    first = errors[0]
+    if first["type"] == "json_invalid":
+        return first["msg"]  # already "Invalid JSON: <parser message>"
+    loc = " -> ".join(str(p) for p in first["loc"])
+    return f"Validation error on '{loc}': {first['msg']}"
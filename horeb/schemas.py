@@ -1,16 +1,17 @@
-from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Literal
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 
 # ---------------------------------------------------------------------------
-# Retrieval dataclass (not a Pydantic model — retrieval concern, not validation)
+# Retrieval dataclass (not a Pydantic model — retrieval concern, not validation).
+# Frozen: retrieve_passage() memoises and shares instances across callers.
+# Slotted: the book pipeline builds one per segment; no per-instance __dict__.
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PassageData:
     reference: str
     book: int               # pythonbible Book enum integer value
@@ -34,6 +35,10 @@ class GroundedBase(BaseModel):
     Enforces: exactly 3 summary items, optional themes, low_confidence_fields list.
     All subclasses inherit the summary length validator automatically.
     """
+    # Pinned explicitly: the book pipeline stamps segment_index / failed_segments
+    # onto validated results in place, which must not re-run the model validators.
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     summary: list[str]
     key_themes: list[str] | None = None
     low_confidence_fields: list[str] = []
@@ -98,24 +103,18 @@ class SegmentResult(GroundedBase):
     source_segments: list[int] = []  # populated at synthesis stage
 
     @model_validator(mode="after")
-    def validate_outline_label_length(self) -> "SegmentResult":
+    def validate_output_budgets(self) -> "SegmentResult":
+        # All three budgets in one hook — one Python callback per segment
+        # instead of three. Checked in the order the errors are reported.
         word_count = len(self.outline_label.split())
         if word_count > 8:
             raise ValueError(
                 f"outline_label must be ≤8 words, got {word_count}: {self.outline_label!r}"
             )
-        return self
-
-    @model_validator(mode="after")
-    def validate_themes_count(self) -> "SegmentResult":
         if self.key_themes is not None and len(self.key_themes) > 3:
             raise ValueError(
                 f"key_themes must have ≤3 items per segment, got {len(self.key_themes)}"
             )
-        return self
-
-    @model_validator(mode="after")
-    def validate_citations_count(self) -> "SegmentResult":
         if len(self.citations) > 5:
             raise ValueError(
                 f"citations must have ≤5 items per segment, got {len(self.citations)}"
@@ -123,7 +122,17 @@ class SegmentResult(GroundedBase):
         return self
 
 
-@dataclass
+class BatchSegmentResult(BaseModel):
+    """
+    Stage 1 output for several segments analysed in one LLM call.
+
+    Only used as the tool schema for stacked calls — each item is re-validated
+    as a SegmentResult on its own, so one bad item does not discard the rest.
+    """
+    results: list[SegmentResult]
+
+
+@dataclass(frozen=True, slots=True)
 class SegmentFailure:
     """Represents a segment that exhausted all repair/retry attempts."""
     segment_index: int
@@ -225,6 +234,15 @@ class QuestionType(str, Enum):
     APPLICATION = "application"
 
 
+# Required study guide question mix, in the order mismatches are reported
+_QUESTION_TYPE_ORDER: tuple[QuestionType, ...] = (
+    QuestionType.COMPREHENSION,
+    QuestionType.REFLECTION,
+    QuestionType.APPLICATION,
+)
+_EXPECTED_QUESTION_COUNTS: tuple[int, ...] = (2, 2, 1)
+
+
 class Entity(BaseModel):
     name: str
     type: str
@@ -249,18 +267,27 @@ class StudyGuideResult(GroundedBase):
 
     @model_validator(mode="after")
     def validate_question_distribution(self) -> "StudyGuideResult":
-        counts = Counter(q.type for q in self.questions)
-        expected = {
-            QuestionType.COMPREHENSION: 2,
-            QuestionType.REFLECTION: 2,
-            QuestionType.APPLICATION: 1,
-        }
-        for qtype, expected_count in expected.items():
-            if counts[qtype] != expected_count:
-                raise ValueError(
-                    f"questions must have exactly {expected_count} "
-                    f"{qtype.value} questions, got {counts.get(qtype, 0)}"
-                )
+        # One pass with plain int tallies, compared as a tuple against the
+        # precomputed expectation; the per-type message is built only on mismatch.
+        # The summary check stays on GroundedBase, shared by every output schema.
+        n_comprehension = n_reflection = n_application = 0
+        for q in self.questions:
+            if q.type is QuestionType.COMPREHENSION:
+                n_comprehension += 1
+            elif q.type is QuestionType.REFLECTION:
+                n_reflection += 1
+            else:
+                n_application += 1
+        counts = (n_comprehension, n_reflection, n_application)
+        if counts != _EXPECTED_QUESTION_COUNTS:
+            for qtype, expected_count, count in zip(
+                _QUESTION_TYPE_ORDER, _EXPECTED_QUESTION_COUNTS, counts
+            ):
+                if count != expected_count:
+                    raise ValueError(
+                        f"questions must have exactly {expected_count} "
+                        f"{qtype.value} questions, got {count}"
+                    )
         return self
 
 
@@ -3,9 +3,10 @@ Shared test infrastructure.
 
 FixtureLLMProvider         — implements LLMProvider Protocol, returns a fixed string.
 SequentialFixtureLLMProvider — returns responses in sequence (for retry path tests).
-load_fixture()             — reads a file from tests/fixtures/responses/<subdir>/.
+load_fixture()             — reads (once) a file from tests/fixtures/responses/<subdir>/.
 Pytest fixtures            — pre-built FixtureLLMProvider instances for common scenarios.
 """
+import functools
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -25,8 +26,12 @@ class FixtureLLMProvider:
     Returns a fixed response string from complete(), allowing full pipeline
     tests without live API calls. The schema and max_tokens parameters are
     accepted to satisfy the LLMProvider Protocol but are not used.
+
+    Slotted, so a misspelt attribute set on the double fails loudly.
     """
 
+    __slots__ = ("_response", "call_count", "last_system", "last_prompt", "last_schema")
+
     def __init__(self, response: str) -> None:
         self._response = response
         self.call_count = 0
@@ -56,6 +61,8 @@ class SequentialFixtureLLMProvider:
     second succeeds (or vice versa).
     """
 
+    __slots__ = ("_responses", "_index", "call_count", "last_prompt")
+
     def __init__(self, responses: list[str]) -> None:
         self._responses = list(responses)
         self._index = 0
@@ -81,10 +88,13 @@ class SequentialFixtureLLMProvider:
         return response
 
 
+@functools.lru_cache(maxsize=None)
 def load_fixture(filename: str, subdir: str = "") -> str:
     """
     Load the content of a fixture file from tests/fixtures/responses/<subdir>/.
 
+    Each file is read once per session; callers share the (immutable) string.
+
     Args:
         filename: The fixture filename (e.g. "john_3_16_valid.json").
         subdir:   Optional subdirectory under responses/ (e.g. "study_guide",
@@ -100,6 +110,10 @@ def load_fixture(filename: str, subdir: str = "") -> str:
 
 # ---------------------------------------------------------------------------
 # Pytest fixtures
+#
+# Session-scoped: the providers are read-only doubles, built once per run.
+# Their call_count / last_* fields therefore accumulate across tests — a test
+# that asserts on them constructs its own FixtureLLMProvider instead.
 # ---------------------------------------------------------------------------
 
 # ---------------------------------------------------------------------------
@@ -107,31 +121,31 @@ def load_fixture(filename: str, subdir: str = "") -> str:
 # still at root until fixture reorganization task runs)
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_john_llm() -> FixtureLLMProvider:
     """LLMProvider that returns a valid John 3:16-21 study guide analysis."""
     return FixtureLLMProvider(load_fixture("john_3_16_valid.json"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malformed_json_llm() -> FixtureLLMProvider:
     """LLMProvider that returns truncated JSON (json_repair can fix it)."""
     return FixtureLLMProvider(load_fixture("malformed_partial.json"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wrong_distribution_llm() -> FixtureLLMProvider:
     """LLMProvider that returns valid JSON with wrong question distribution."""
     return FixtureLLMProvider(load_fixture("wrong_question_distribution.json"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wrong_summary_llm() -> FixtureLLMProvider:
     """LLMProvider that returns valid JSON with wrong summary length."""
     return FixtureLLMProvider(load_fixture("wrong_summary_length.json"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def out_of_range_citation_llm() -> FixtureLLMProvider:
     """LLMProvider that returns an out-of-range citation (John 3:22)."""
     return FixtureLLMProvider(load_fixture("out_of_range_citation.json"))
@@ -10,11 +10,17 @@ Covers test matrix items:
 - 6: Context clamped at book end
 - 7: Single-chapter books
 """
+import threading
+
 import pytest
 
+import pythonbible as pb
+
+from horeb import bible_text
 from horeb.bible_text import (
     MAX_PASSAGE_VERSES,
     Granularity,
+    _fast_parse,
     detect_granularity,
     retrieve_passage,
 )
@@ -56,6 +62,13 @@ class TestValidReferences:
         p = retrieve_passage("Romans 8:1-4")
         assert len(p.text.strip()) > 50
 
+    def test_repeat_retrieval_returns_shared_frozen_passage(self):
+        p1 = retrieve_passage("John 3:16-21")
+        p2 = retrieve_passage("John 3:16-21")
+        assert p1 is p2
+        with pytest.raises(AttributeError):
+            p1.text = ""
+
 
 # ---------------------------------------------------------------------------
 # Single-chapter books
@@ -124,6 +137,12 @@ class TestContextBoundaryClamping:
         assert p.context_before is not None
         assert "[3:" in p.context_before
 
+    def test_out_of_range_start_chapter_has_no_context(self):
+        # pythonbible accepts chapter 0; the context walk must not run into chapter 1
+        p = retrieve_passage("John 0:1")
+        assert p.context_before is None
+        assert p.context_after is None
+
 
 # ---------------------------------------------------------------------------
 # Invalid references
@@ -198,19 +217,43 @@ class TestGranularityDetection:
             detect_granularity("hello world")
 
     def test_ref_object_has_correct_book_for_passage(self):
-        import pythonbible as pb
         ref, _ = detect_granularity("John 3:16-21")
         assert ref.book == pb.Book.JOHN
         assert ref.start_chapter == 3
         assert ref.start_verse == 16
 
     def test_ref_object_has_correct_book_for_chapter(self):
-        import pythonbible as pb
         ref, _ = detect_granularity("Romans 8")
         assert ref.book == pb.Book.ROMANS
         assert ref.start_chapter == 8
 
 
+# ---------------------------------------------------------------------------
+# Regex fast path
+# ---------------------------------------------------------------------------
+
+class TestFastParse:
+    @pytest.mark.parametrize("reference", [
+        "John 3:16-21",
+        "John 3",
+        "Psalm 23:1-6",
+        "1 Corinthians 13:4",
+        "John 3:16-4:2",
+    ])
+    def test_matches_pythonbible(self, reference):
+        assert _fast_parse(reference) == pb.get_references(reference)[0]
+
+    @pytest.mark.parametrize("reference", [
+        "Jude 3",            # single-chapter book: number is a verse
+        "John 3:40",         # verse past end of chapter
+        "John 3:21-16",      # reversed range
+        "Song of Songs 2:1", # multi-word name
+        "Ruth",              # book only
+    ])
+    def test_defers_to_pythonbible(self, reference):
+        assert _fast_parse(reference) is None
+
+
 # ---------------------------------------------------------------------------
 # Passage length limit
 # ---------------------------------------------------------------------------
@@ -230,3 +273,56 @@ class TestPassageLengthLimit:
     def test_one_over_max_rejected(self):
         with pytest.raises(InvalidReferenceError, match="maximum"):
             retrieve_passage(f"John 1:1-{MAX_PASSAGE_VERSES + 1}")
+
+
+# ---------------------------------------------------------------------------
+# Corpus loading
+# ---------------------------------------------------------------------------
+
+class TestCorpusLoading:
+    _REFERENCES = ["Jude 1:3-5", "Psalm 23:1-6", "Romans 8:28-30", "John 3:16-21"] * 2
+
+    def test_concurrent_cold_load_returns_full_text(self, monkeypatch):
+        """Threads racing the first load never see a partly built corpus."""
+        expected = {ref: retrieve_passage(ref).text for ref in self._REFERENCES}
+        monkeypatch.setattr(bible_text, "_TEXT", None)
+        retrieve_passage.cache_clear()
+        barrier = threading.Barrier(len(self._REFERENCES))
+        results: dict[int, str] = {}
+
+        def _worker(i: int, ref: str) -> None:
+            barrier.wait()
+            results[i] = retrieve_passage(ref).text
+
+        try:
+            threads = [
+                threading.Thread(target=_worker, args=(i, ref))
+                for i, ref in enumerate(self._REFERENCES)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            retrieve_passage.cache_clear()
+
+        assert [results[i] for i in range(len(self._REFERENCES))] == [
+            expected[ref] for ref in self._REFERENCES
+        ]
+
+    def test_verse_lookup_loads_cold_corpus(self, monkeypatch):
+        monkeypatch.setattr(bible_text, "_TEXT", None)
+        assert bible_text._get_verse_text(pb.Book.JOHN.value, 3, 16).startswith("For God")
+        assert bible_text._TEXT is not None and len(bible_text._TEXT) == 31102
+
+    @pytest.mark.parametrize("loader", ["_read_corpus", "_read_corpus_public"])
+    def test_corpus_has_every_asv_verse(self, loader):
+        corpus = getattr(bible_text, loader)()
+        assert len(corpus) == 31102
+        assert corpus[1001001] == "In the beginning God created the heavens and the earth."
+        assert corpus[43003016].startswith("For God so loved the world")
+        assert corpus[66022021] == "The grace of the Lord Jesus be with the saints. Amen."
+
+    def test_missing_pythonbible_internals_fall_back_to_public_api(self, monkeypatch):
+        monkeypatch.setattr("pythonbible.bible.get_bible", lambda *args: object())
+        assert bible_text._read_corpus() == bible_text._read_corpus_public()
@@ -475,3 +475,22 @@ class TestTagsFlag:
         mock_find.assert_called_once()
         _, kwargs = mock_find.call_args
         assert kwargs.get("tags") is False
+
+
+# ---------------------------------------------------------------------------
+# --batch flag: analyze passes batch=True through to the engine wrapper
+# ---------------------------------------------------------------------------
+
+class TestBatchFlag:
+    def test_batch_flag_passed_to_analyze(self):
+        with patch("horeb.cli.analyze", return_value=_valid_result()) as mock_analyze:
+            runner.invoke(app, ["analyze", "Ruth", "--batch"])
+        mock_analyze.assert_called_once()
+        _, kwargs = mock_analyze.call_args
+        assert kwargs.get("batch") is True
+
+    def test_no_batch_flag_default_false(self):
+        with patch("horeb.cli.analyze", return_value=_valid_result()) as mock_analyze:
+            runner.invoke(app, ["analyze", "Ruth"])
+        _, kwargs = mock_analyze.call_args
+        assert kwargs.get("batch") is False
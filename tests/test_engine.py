@@ -18,9 +18,12 @@ import pythonbible as pb
 
 from horeb.bible_text import Segment, retrieve_passage
 from horeb.engine import (
+    CitationMode,
     analyze,
+    analyze_many,
     analyze_passage,
     analyze_study_guide,
+    build_valid_refs,
     extract_verse_refs,
     find_similar,
     verify_citations,
@@ -41,6 +44,7 @@ from horeb.schemas import (
     PassageData,
     SegmentResult,
     StudyGuideResult,
+    VerseCitation,
 )
 from tests.conftest import (
     FixtureLLMProvider,
@@ -158,6 +162,60 @@ class TestCitationVerification:
         refs = extract_verse_refs(result)
         assert refs == ["3:16", "3:19", "3:21"]
 
+    def test_extract_verse_refs_from_outline_anchors(self):
+        result = BookAnalysisResult(
+            summary=["A.", "B.", "C."],
+            outline=[
+                OutlineSection(
+                    title="Opening", start_verse="1:1", end_verse="1:22", source_segments=[0]
+                ),
+                OutlineSection(
+                    title="Harvest", start_verse="2:1", end_verse="", source_segments=[1]
+                ),
+            ],
+        )
+        assert extract_verse_refs(result) == ["1:1", "1:22", "2:1"]
+
+    def test_extract_verse_refs_from_passage_citations(self):
+        result = PassageAnalysisResult(
+            summary=["A.", "B.", "C."],
+            citations=[VerseCitation(verse_reference="3:16"), VerseCitation(verse_reference="")],
+        )
+        assert extract_verse_refs(result) == ["3:16"]
+
+    def test_full_citation_in_numbered_book_passes(self):
+        """'1 John 1:3' is a full reference, not a short 'C:V' form."""
+        result = PassageAnalysisResult(
+            summary=["A.", "B.", "C."],
+            citations=[VerseCitation(verse_reference="1 John 1:3")],
+        )
+        verify_citations(result, retrieve_passage("1 John 1:1-4"))
+
+    def test_build_valid_refs_unions_segment_citations(self):
+        segs = [
+            SegmentResult(
+                segment_index=i,
+                outline_label="Label",
+                summary=["A.", "B.", "C."],
+                citations=[VerseCitation(verse_reference=ref) for ref in refs],
+            )
+            for i, refs in enumerate([["1:1", "1:4"], ["2:3", "1:4"]])
+        ]
+        assert build_valid_refs(segs) == frozenset({"1:1", "1:4", "2:3"})
+
+    def test_synthesis_mode_rejects_ref_outside_valid_refs(self):
+        seg = SegmentResult(
+            segment_index=0,
+            outline_label="Label",
+            summary=["A.", "B.", "C."],
+            citations=[VerseCitation(verse_reference="2:3")],
+        )
+        with pytest.raises(CitationOutOfRangeError):
+            verify_citations(
+                seg, passage=None, mode=CitationMode.SYNTHESIS,
+                valid_refs=frozenset({"1:1"}),
+            )
+
 
 # ---------------------------------------------------------------------------
 # AnalysisFailedError propagation
@@ -257,6 +315,36 @@ class TestAnalyzeRouting:
         assert mock_ab.called
 
 
+class TestAnalyzeMany:
+    def test_results_returned_in_input_order(self):
+        def fake_analyze_passage(passage, _llm):
+            return PassageAnalysisResult(summary=[passage.reference, "B.", "C."], citations=[])
+
+        book_result = BookAnalysisResult(summary=["Ruth", "B.", "C."], outline=[])
+        refs = ["John 3:16-21", "Ruth", "John 3", "Romans 8:28"]
+        with patch("horeb.engine.analyze_passage", side_effect=fake_analyze_passage):
+            with patch("horeb.engine.analyze_book", return_value=book_result) as mock_ab:
+                results = analyze_many(refs, llm=FixtureLLMProvider(""))
+        assert [r.summary[0] for r in results] == [
+            "John 3:16-21", "Ruth", "John 3:1-36", "Romans 8:28",
+        ]
+        mock_ab.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("refs", "match"),
+        [
+            (["John 3:16", "Not A Book 1:1"], None),
+            (["John 3:16-21", "Genesis 1:1-2:25"], "maximum"),   # over-long passage
+            (["Psalms", "John 3:16-21"], "segments"),            # over-long book
+        ],
+    )
+    def test_invalid_reference_raises_before_any_llm_call(self, refs, match):
+        llm = FixtureLLMProvider("")
+        with pytest.raises(InvalidReferenceError, match=match):
+            analyze_many(refs, llm=llm)
+        assert llm.call_count == 0
+
+
 # ---------------------------------------------------------------------------
 # analyze_passage() pipeline
 # ---------------------------------------------------------------------------
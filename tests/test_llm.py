@@ -0,0 +1,160 @@
+"""
+Tests for the ClaudeProvider response cache (HOREB_CACHE=1) and Message Batch
+submission (complete_batch).
+
+The Anthropic client is replaced with a stub — no network calls.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from horeb.llm import BatchRequest, ClaudeProvider, _ResponseCache
+from horeb.schemas import SegmentResult
+
+
+class _StubMessages:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=f"reply {self.calls}")])
+
+
+def _provider(monkeypatch, tmp_path, cache: str) -> tuple[ClaudeProvider, _StubMessages]:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("HOREB_CACHE", cache)
+    provider = ClaudeProvider()
+    messages = _StubMessages()
+    provider._client = SimpleNamespace(messages=messages)
+    return provider, messages
+
+
+class TestResponseCache:
+    def test_round_trip(self, tmp_path):
+        cache = _ResponseCache(str(tmp_path / "r.sqlite3"))
+        key = _ResponseCache.key({"system": "s", "prompt": "p"})
+        assert cache.get(key) is None
+        cache.put(key, '{"a": 1}')
+        assert cache.get(key) == '{"a": 1}'
+
+    def test_key_depends_on_every_param(self):
+        base = {"model": "m", "max_tokens": 10, "system": "s"}
+        assert _ResponseCache.key(base) == _ResponseCache.key(dict(reversed(base.items())))
+        assert _ResponseCache.key(base) != _ResponseCache.key({**base, "max_tokens": 11})
+
+    def test_repeat_request_served_from_cache(self, monkeypatch, tmp_path):
+        provider, messages = _provider(monkeypatch, tmp_path, cache="1")
+        first = provider.complete(system="s", prompt="p")
+        second = provider.complete(system="s", prompt="p")
+        assert first == second == "reply 1"
+        assert messages.calls == 1
+        provider.complete(system="s", prompt="different")
+        assert messages.calls == 2
+
+    def test_cache_off_by_default(self, monkeypatch, tmp_path):
+        provider, messages = _provider(monkeypatch, tmp_path, cache="")
+        provider.complete(system="s", prompt="p")
+        provider.complete(system="s", prompt="p")
+        assert messages.calls == 2
+        assert not (tmp_path / "horeb").exists()
+
+
+class _StubBatches:
+    """Message Batches stub: ends after polls_to_end retrieve() calls (never if None)."""
+
+    def __init__(self, results: list, polls_to_end: int | None = 2) -> None:
+        self._results = results
+        self._polls_to_end = polls_to_end
+        self.retrieve_calls = 0
+        self.canceled: list[str] = []
+        self.submitted: list = []
+
+    def _batch(self, ended: bool):
+        return SimpleNamespace(id="b1", processing_status="ended" if ended else "in_progress")
+
+    def create(self, requests):
+        self.submitted = requests
+        return self._batch(self._polls_to_end == 0)
+
+    def retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        return self._batch(
+            self._polls_to_end is not None and self.retrieve_calls >= self._polls_to_end
+        )
+
+    def results(self, batch_id):
+        return iter(self._results)
+
+    def cancel(self, batch_id):
+        self.canceled.append(batch_id)
+
+
+def _batch_entry(custom_id: str, result_type: str = "succeeded", content: list | None = None):
+    message = SimpleNamespace(content=content or [])
+    return SimpleNamespace(
+        custom_id=custom_id, result=SimpleNamespace(type=result_type, message=message)
+    )
+
+
+def _tool_use(payload: dict):
+    return SimpleNamespace(type="tool_use", input=payload)
+
+
+def _batch_provider(monkeypatch, batches: _StubBatches) -> ClaudeProvider:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("HOREB_CACHE", "")
+    monkeypatch.setattr("horeb.llm.time.sleep", lambda _seconds: None)
+    provider = ClaudeProvider(use_batch=True)
+    provider._client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    return provider
+
+
+def _requests(*custom_ids: str) -> list[BatchRequest]:
+    return [
+        BatchRequest(custom_id=i, system="s", prompt=f"p{i}", schema=SegmentResult)
+        for i in custom_ids
+    ]
+
+
+class TestCompleteBatch:
+    def test_polls_until_ended(self, monkeypatch):
+        batches = _StubBatches([_batch_entry("0", content=[_tool_use({"a": 1})])], polls_to_end=3)
+        provider = _batch_provider(monkeypatch, batches)
+        assert provider.complete_batch(_requests("0")) == {"0": '{"a": 1}'}
+        assert batches.retrieve_calls == 3
+        assert [r["custom_id"] for r in batches.submitted] == ["0"]
+
+    def test_only_succeeded_results_returned(self, monkeypatch):
+        batches = _StubBatches([
+            _batch_entry("0", content=[_tool_use({"a": 1})]),
+            _batch_entry("1", result_type="errored"),
+            _batch_entry("2", result_type="expired"),
+            _batch_entry("3", result_type="canceled"),
+        ])
+        provider = _batch_provider(monkeypatch, batches)
+        assert provider.complete_batch(_requests("0", "1", "2", "3")) == {"0": '{"a": 1}'}
+
+    def test_succeeded_result_without_tool_call_is_omitted(self, monkeypatch):
+        text_only = SimpleNamespace(type="text", text="no tool call")
+        batches = _StubBatches([
+            _batch_entry("0", content=[text_only]),
+            _batch_entry("1", content=[_tool_use({"b": 2})]),
+        ])
+        provider = _batch_provider(monkeypatch, batches)
+        assert provider.complete_batch(_requests("0", "1")) == {"1": '{"b": 2}'}
+
+    def test_empty_request_list_submits_nothing(self, monkeypatch):
+        batches = _StubBatches([])
+        provider = _batch_provider(monkeypatch, batches)
+        assert provider.complete_batch([]) == {}
+        assert batches.submitted == []
+
+    def test_batch_that_never_ends_times_out_and_is_canceled(self, monkeypatch):
+        batches = _StubBatches([], polls_to_end=None)
+        provider = _batch_provider(monkeypatch, batches)
+        monkeypatch.setattr("horeb.llm._BATCH_MAX_WAIT_SECONDS", 0.0)
+        with pytest.raises(TimeoutError, match="b1"):
+            provider.complete_batch(_requests("0"))
+        assert batches.canceled == ["b1"]
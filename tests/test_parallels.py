@@ -0,0 +1,34 @@
+"""
+Tests for parallels.score_similarity() — deterministic TF-IDF scoring.
+
+Runs against the real ASV corpus; no LLM involved.
+"""
+import pythonbible as pb
+
+from horeb.bible_text import retrieve_passage
+from horeb.parallels import score_similarity
+
+
+class TestSeedExclusion:
+    def test_seed_verses_excluded_from_own_book(self):
+        """Verses inside the seed passage are never returned as candidates."""
+        seed = retrieve_passage("John 3:16-21")
+        refs = {c.reference for c in score_similarity(seed, top_n=50)}
+        assert not refs & {f"John 3:{v}" for v in range(16, 22)}
+
+    def test_same_coordinates_in_other_scope_book_not_excluded(self):
+        """Genesis 1:1-5 must not hide John 1:1-5 when scoped to John."""
+        seed = retrieve_passage("Genesis 1:1-5")
+        refs = [c.reference for c in score_similarity(seed, scope_book=pb.Book.JOHN)]
+        assert "John 1:5" in refs
+
+
+class TestDeterminism:
+    def test_repeat_call_returns_same_ranking(self):
+        seed = retrieve_passage("Psalm 23:1-6")
+        first = score_similarity(seed, scope_book=pb.Book.JOHN)
+        second = score_similarity(seed, scope_book=pb.Book.JOHN)
+        assert first == second
+        assert [c.similarity_score for c in first] == sorted(
+            (c.similarity_score for c in first), reverse=True
+        )
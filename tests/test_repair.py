@@ -10,9 +10,10 @@ Covers test matrix items:
 import json
 
 import pytest
+from pydantic import BaseModel, model_validator
 
 from horeb.errors import AnalysisFailedError
-from horeb.repair import _get_failure_reason, _try_parse, repair_and_validate
+from horeb.repair import _describe_failure, _parse, _try_parse, repair_and_validate
 from horeb.schemas import StudyGuideResult
 from tests.conftest import FixtureLLMProvider, SequentialFixtureLLMProvider, load_fixture
 
@@ -51,25 +52,41 @@ class TestTryParse:
     def test_empty_object_returns_none(self):
         assert _try_parse("{}", _SCHEMA) is None
 
+    def test_validator_bug_propagates(self):
+        """Only validation failures become None — a broken validator is not swallowed."""
+        class _Broken(BaseModel):
+            value: int
+
+            @model_validator(mode="after")
+            def _explode(self):
+                raise TypeError("bug in validator")
+
+        with pytest.raises(TypeError):
+            _try_parse('{"value": 1}', _Broken)
+
 
 # ---------------------------------------------------------------------------
-# _get_failure_reason
+# _describe_failure
 # ---------------------------------------------------------------------------
 
-class TestGetFailureReason:
+class TestDescribeFailure:
     def test_invalid_json_describes_parse_error(self):
-        reason = _get_failure_reason("{bad json", _SCHEMA)
+        reason = _describe_failure(_parse("{bad json", _SCHEMA)[1])
         assert "Invalid JSON" in reason or "JSON" in reason
 
     def test_wrong_distribution_describes_field(self):
         raw = load_fixture("wrong_question_distribution.json")
-        reason = _get_failure_reason(raw, _SCHEMA)
+        reason = _describe_failure(_parse(raw, _SCHEMA)[1])
         assert len(reason) > 0  # produces some description
 
+    def test_missing_field_names_location(self):
+        reason = _describe_failure(_parse("{}", _SCHEMA)[1])
+        assert reason == "Validation error on 'summary': Field required"
+
     def test_valid_payload_returns_unknown(self):
         # Internally: valid JSON + valid Pydantic → "Unknown validation error"
         valid = load_fixture("john_3_16_valid.json")
-        reason = _get_failure_reason(valid, _SCHEMA)
+        reason = _describe_failure(_parse(valid, _SCHEMA)[1])
         assert "Unknown" in reason
 
 
@@ -103,10 +120,23 @@ class TestStage2JsonRepair:
         raw = load_fixture("malformed_partial.json")
         valid_fallback = load_fixture("john_3_16_valid.json")
         llm = FixtureLLMProvider(valid_fallback)
-        # If json_repair succeeds → result is returned, llm not called
-        # If json_repair fails → llm is called once
-        result, _ = repair_and_validate(raw, schema=_SCHEMA, llm=llm, system_prompt=_SYSTEM, user_prompt="")
+        # json_repair closes the truncated payload → result returned, llm not called
+        result, retry_calls = repair_and_validate(raw, schema=_SCHEMA, llm=llm, system_prompt=_SYSTEM, user_prompt="")
         assert isinstance(result, StudyGuideResult)
+        assert llm.call_count == 0
+        assert retry_calls == 0
+
+    @pytest.mark.parametrize("raw", ["", "I cannot analyse this passage."])
+    def test_non_json_output_skips_repair(self, raw, monkeypatch):
+        """Text with no '{' or '[' goes straight to the retry without json_repair."""
+        def _fail(_raw):
+            raise AssertionError("json_repair should not be called")
+
+        monkeypatch.setattr("horeb.repair.json_repair.repair_json", _fail)
+        llm = SequentialFixtureLLMProvider([load_fixture("john_3_16_valid.json")])
+        result, retry_calls = repair_and_validate(raw, schema=_SCHEMA, llm=llm, system_prompt=_SYSTEM, user_prompt="")
+        assert isinstance(result, StudyGuideResult)
+        assert retry_calls == 1
 
 
 # ---------------------------------------------------------------------------
@@ -79,6 +79,24 @@ class TestSegmentBookRuth:
             assert s1.end_chapter == s2.end_chapter
             assert s1.end_verse == s2.end_verse
 
+    def test_repeat_call_reuses_cached_segments(self):
+        """Second call returns a fresh list over the memoised Segment objects."""
+        segs1 = segment_book(pb.Book.RUTH)
+        segs2 = segment_book(pb.Book.RUTH)
+        assert segs1 is not segs2
+        assert all(s1 is s2 for s1, s2 in zip(segs1, segs2))
+
+    def test_segments_are_immutable(self):
+        """Shared memoised segments cannot be mutated by a caller."""
+        seg = segment_book(pb.Book.RUTH)[0]
+        with pytest.raises(AttributeError):
+            seg.text = ""
+
+    def test_stripped_text_length_precomputed(self):
+        """text_len_stripped matches the length of the stripped segment text."""
+        for seg in segment_book(pb.Book.RUTH):
+            assert seg.text_len_stripped == len(seg.text.strip())
+
     def test_segment_indices_contiguous(self):
         """Segment indices are 0, 1, 2, … N-1 with no gaps."""
         segments = segment_book(pb.Book.RUTH)
@@ -154,3 +172,21 @@ class TestExceedsMaxSegments:
         """Psalms has 150 chapters, far exceeding MAX_BOOK_SEGMENTS=60."""
         with pytest.raises(InvalidReferenceError, match="segments"):
             segment_book(pb.Book.PSALMS)
+
+
+# ---------------------------------------------------------------------------
+# Precomputed chapter verse-count table
+# ---------------------------------------------------------------------------
+
+class TestChapterVerseTable:
+    def test_counts_match_pythonbible(self):
+        """Table lookups agree with pythonbible for every chapter of John."""
+        for ch in range(1, pb.get_number_of_chapters(pb.Book.JOHN) + 1):
+            assert _count_chapter_verses(pb.Book.JOHN, ch) == pb.get_number_of_verses(
+                pb.Book.JOHN, ch
+            )
+
+    def test_out_of_range_chapter_returns_zero(self):
+        """Chapters past the end of the book (or below 1) count as 0 verses."""
+        assert _count_chapter_verses(pb.Book.JOHN, 22) == 0
+        assert _count_chapter_verses(pb.Book.JOHN, 0) == 0
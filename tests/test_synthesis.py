@@ -7,17 +7,26 @@ Covers:
 - failed_segments propagation to BookAnalysisResult
 - Synthesis user prompt structure (no raw Bible text beyond verse_texts param)
 """
+import json
 import re
 from unittest.mock import patch
 
 import pytest
 import pythonbible as pb
 
-from horeb.bible_text import Segment
-from horeb.engine import analyze_book, verify_synthesis_grounding
+from horeb.bible_text import MAX_BOOK_LLM_CALLS, Segment
+from horeb.engine import (
+    _MAX_PARALLEL_WORKERS,
+    _SEGMENTS_PER_CALL,
+    _segments_per_call,
+    _stage1_workers,
+    analyze_book,
+    verify_synthesis_grounding,
+)
 from horeb.errors import AnalysisFailedError, CitationOutOfRangeError
 from horeb.prompts import build_synthesis_user_prompt
 from horeb.schemas import (
+    BatchSegmentResult,
     BookAnalysisResult,
     OutlineSection,
     SegmentFailure,
@@ -161,10 +170,10 @@ class TestAnalyzeBookPartialFailures:
         fake_segs = _make_fake_segments(n)
         llm = FixtureLLMProvider(load_fixture(synthesis_fixture, subdir="book"))
 
-        def fake_run_segment(seg, _llm, _sys):
+        def fake_run_segment(seg, _llm, _sys, _raw=None):
             if seg.segment_index in failing_indices:
-                return _make_seg_failure(seg.segment_index), 0
-            return _make_seg_result(seg.segment_index), 1
+                return _make_seg_failure(seg.segment_index)
+            return _make_seg_result(seg.segment_index)
 
         with patch("horeb.engine.segment_book", return_value=fake_segs):
             with patch("horeb.engine._run_segment", side_effect=fake_run_segment):
@@ -185,10 +194,10 @@ class TestAnalyzeBookPartialFailures:
         fake_segs = _make_fake_segments(4)
         llm = FixtureLLMProvider("")
 
-        def fake_run_segment(seg, _llm, _sys):
+        def fake_run_segment(seg, _llm, _sys, _raw=None):
             if seg.segment_index in {0, 1, 2}:
-                return _make_seg_failure(seg.segment_index), 0
-            return _make_seg_result(seg.segment_index), 1
+                return _make_seg_failure(seg.segment_index)
+            return _make_seg_result(seg.segment_index)
 
         with patch("horeb.engine.segment_book", return_value=fake_segs):
             with patch("horeb.engine._run_segment", side_effect=fake_run_segment):
@@ -215,6 +224,244 @@ class TestAnalyzeBookPartialFailures:
             assert idx not in result.failed_segments
 
 
+# ---------------------------------------------------------------------------
+# analyze_book() batch submission (providers with supports_batch)
+# ---------------------------------------------------------------------------
+
+class _BatchFixtureLLMProvider(FixtureLLMProvider):
+    """FixtureLLMProvider that also answers complete_batch() with a fixed response."""
+
+    supports_batch = True
+
+    def __init__(self, response: str, batch_response: str, drop_ids: set[str] = frozenset()) -> None:
+        super().__init__(response)
+        self._batch_response = batch_response
+        self._drop_ids = drop_ids
+        self.batch_requests: list = []
+
+    def complete_batch(self, requests):
+        self.batch_requests = list(requests)
+        return {
+            r.custom_id: self._batch_response
+            for r in requests
+            if r.custom_id not in self._drop_ids
+        }
+
+
+class TestAnalyzeBookBatch:
+    def _run(self, llm) -> dict[int, str | None]:
+        raws: dict[int, str | None] = {}
+
+        def fake_run_segment(seg, _llm, _sys, raw=None):
+            raws[seg.segment_index] = raw
+            return _make_seg_result(seg.segment_index)
+
+        with patch("horeb.engine.segment_book", return_value=_make_fake_segments(4)):
+            with patch("horeb.engine._run_segment", side_effect=fake_run_segment):
+                with patch("horeb.engine.verify_synthesis_grounding"):
+                    analyze_book("Ruth", llm=llm)
+        return raws
+
+    def test_segments_submitted_as_one_batch(self):
+        llm = _BatchFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"), batch_response="{}"
+        )
+        raws = self._run(llm)
+        assert [r.custom_id for r in llm.batch_requests] == ["0", "1", "2", "3"]
+        assert raws == {0: "{}", 1: "{}", 2: "{}", 3: "{}"}
+
+    def test_segment_missing_from_batch_gets_no_prefetched_raw(self):
+        llm = _BatchFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"),
+            batch_response="{}",
+            drop_ids={"2"},
+        )
+        raws = self._run(llm)
+        assert raws[2] is None
+        assert raws[0] == "{}"
+
+    def test_failed_batch_never_exceeds_ceiling(self):
+        """60 segments, every batch request errors and every individual call needs a retry."""
+        llm = _BatchFixtureLLMProvider(
+            "{}", batch_response="{}", drop_ids={str(i) for i in range(60)}
+        )
+        with patch("horeb.engine.segment_book", return_value=_make_fake_segments(60)):
+            with pytest.raises(AnalysisFailedError, match="Too many segment failures"):
+                analyze_book("Ruth", llm=llm)
+        # Batch requests plus individual calls stop at the ceiling, less the
+        # 2 calls reserved for synthesis
+        assert len(llm.batch_requests) == 60
+        assert len(llm.batch_requests) + llm.call_count == MAX_BOOK_LLM_CALLS - 2
+
+    def test_non_batch_provider_never_prefetches(self):
+        llm = FixtureLLMProvider(load_fixture("book_synthesis_valid.json", subdir="book"))
+        raws = self._run(llm)
+        assert all(raw is None for raw in raws.values())
+
+
+# ---------------------------------------------------------------------------
+# analyze_book() stacked stage 1 calls (HOREB_SEGMENTS_PER_CALL > 1)
+# ---------------------------------------------------------------------------
+
+class _StackedFixtureLLMProvider(FixtureLLMProvider):
+    """
+    Answers stacked segment calls with one result per SEGMENT header in the prompt,
+    and individual segment calls with that segment's result (or segment_response,
+    if given). Counts every call.
+    """
+
+    def __init__(
+        self,
+        response: str,
+        drop_indices: set[int] = frozenset(),
+        fail: bool = False,
+        segment_response: str | None = None,
+    ) -> None:
+        super().__init__(response)
+        self._drop_indices = drop_indices
+        self._fail = fail
+        self._segment_response = segment_response
+        self.stacked_prompts: list[str] = []
+
+    def complete(self, system, prompt, schema=None, max_tokens=None):
+        if schema is SegmentResult:
+            self.call_count += 1
+            if self._segment_response is not None:
+                return self._segment_response
+            index = int(re.match(r"SEGMENT (\d+) ", prompt).group(1))
+            return _make_seg_result(index).model_dump_json()
+        if schema is not BatchSegmentResult:
+            return super().complete(system, prompt, schema, max_tokens)
+        self.call_count += 1
+        self.stacked_prompts.append(prompt)
+        if self._fail:
+            raise RuntimeError("simulated API error")
+        indices = [int(i) for i in re.findall(r"^SEGMENT (\d+) ", prompt, re.MULTILINE)]
+        results = [
+            _make_seg_result(i).model_dump() for i in indices if i not in self._drop_indices
+        ]
+        return json.dumps({"results": results})
+
+
+class TestAnalyzeBookStacked:
+    def _run(self, llm, monkeypatch, per_call: str = "2") -> dict[int, str | None]:
+        monkeypatch.setenv("HOREB_SEGMENTS_PER_CALL", per_call)
+        raws: dict[int, str | None] = {}
+
+        def fake_run_segment(seg, _llm, _sys, raw=None):
+            raws[seg.segment_index] = raw
+            return _make_seg_result(seg.segment_index)
+
+        with patch("horeb.engine.segment_book", return_value=_make_fake_segments(4)):
+            with patch("horeb.engine._run_segment", side_effect=fake_run_segment):
+                with patch("horeb.engine.verify_synthesis_grounding"):
+                    analyze_book("Ruth", llm=llm)
+        return raws
+
+    def test_segments_grouped_into_stacked_calls(self, monkeypatch):
+        llm = _StackedFixtureLLMProvider(load_fixture("book_synthesis_valid.json", subdir="book"))
+        raws = self._run(llm, monkeypatch)
+        assert len(llm.stacked_prompts) == 2
+        assert {i: json.loads(raw)["segment_index"] for i, raw in raws.items()} == {
+            0: 0, 1: 1, 2: 2, 3: 3,
+        }
+
+    def test_segment_missing_from_response_gets_no_prefetched_raw(self, monkeypatch):
+        llm = _StackedFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"), drop_indices={2}
+        )
+        raws = self._run(llm, monkeypatch)
+        assert raws[2] is None
+        assert raws[3] is not None
+
+    def test_failed_stacked_call_falls_back_to_individual_calls(self, monkeypatch):
+        llm = _StackedFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"), fail=True
+        )
+        raws = self._run(llm, monkeypatch)
+        assert all(raw is None for raw in raws.values())
+
+    def test_default_makes_no_stacked_calls(self, monkeypatch):
+        llm = _StackedFixtureLLMProvider(load_fixture("book_synthesis_valid.json", subdir="book"))
+        raws = self._run(llm, monkeypatch, per_call="1")
+        assert llm.stacked_prompts == []
+        assert all(raw is None for raw in raws.values())
+
+    @pytest.mark.parametrize(
+        ("drop_indices", "fail", "expected_calls"),
+        [
+            (frozenset(), False, 3),   # 2 stacked + synthesis
+            ({2}, False, 4),           # 2 stacked + 1 individual + synthesis
+            (frozenset(), True, 7),    # 2 failed stacked + 4 individual + synthesis
+        ],
+    )
+    def test_total_llm_calls_counted_once_per_request(
+        self, monkeypatch, capsys, drop_indices, fail, expected_calls
+    ):
+        monkeypatch.setenv("HOREB_SEGMENTS_PER_CALL", "2")
+        llm = _StackedFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"),
+            drop_indices=drop_indices,
+            fail=fail,
+        )
+        with patch("horeb.engine.segment_book", return_value=_make_fake_segments(4)):
+            with patch("horeb.engine.verify_synthesis_grounding"):
+                analyze_book("Ruth", llm=llm)
+        assert llm.call_count == expected_calls
+        assert f"{expected_calls} LLM calls made" in capsys.readouterr().err
+
+    def test_failed_stacked_calls_never_exceed_ceiling(self, monkeypatch):
+        """60 segments, every stacked call fails and every individual call needs a retry."""
+        monkeypatch.setenv("HOREB_SEGMENTS_PER_CALL", "2")
+        llm = _StackedFixtureLLMProvider(
+            load_fixture("book_synthesis_valid.json", subdir="book"),
+            fail=True,
+            segment_response="{}",
+        )
+        with patch("horeb.engine.segment_book", return_value=_make_fake_segments(60)):
+            with pytest.raises(AnalysisFailedError, match="Too many segment failures"):
+                analyze_book("Ruth", llm=llm)
+        # Stage 1 stops at the ceiling, less the 2 calls reserved for synthesis
+        assert llm.call_count == MAX_BOOK_LLM_CALLS - 2
+
+
+class TestSegmentsPerCall:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("HOREB_SEGMENTS_PER_CALL", raising=False)
+        assert _segments_per_call() == _SEGMENTS_PER_CALL
+
+    def test_invalid_env_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("HOREB_SEGMENTS_PER_CALL", "many")
+        assert _segments_per_call() == _SEGMENTS_PER_CALL
+
+    def test_never_below_one(self, monkeypatch):
+        monkeypatch.setenv("HOREB_SEGMENTS_PER_CALL", "0")
+        assert _segments_per_call() == 1
+
+
+# ---------------------------------------------------------------------------
+# Stage 1 concurrency
+# ---------------------------------------------------------------------------
+
+class TestStage1Workers:
+    def test_default_worker_count(self, monkeypatch):
+        monkeypatch.delenv("HOREB_MAX_WORKERS", raising=False)
+        assert _stage1_workers(40) == _MAX_PARALLEL_WORKERS
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("HOREB_MAX_WORKERS", "16")
+        assert _stage1_workers(40) == 16
+
+    def test_invalid_env_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("HOREB_MAX_WORKERS", "lots")
+        assert _stage1_workers(40) == _MAX_PARALLEL_WORKERS
+
+    def test_never_more_workers_than_segments(self, monkeypatch):
+        monkeypatch.setenv("HOREB_MAX_WORKERS", "16")
+        assert _stage1_workers(3) == 3
+        assert _stage1_workers(0) == 1
+
+
 # ---------------------------------------------------------------------------
 # Synthesis user prompt structure
 # ---------------------------------------------------------------------------
@@ -243,6 +490,13 @@ class TestSynthesisPromptStructure:
         assert "ANALYSIS FAILED" in prompt
         assert "Segment 1" in prompt
 
+    def test_segments_and_failures_interleaved_in_index_order(self):
+        """Blocks follow segment_index regardless of input order."""
+        segs = [_make_seg_result(2), _make_seg_result(0)]
+        failures = [SegmentFailure(segment_index=1, chapter_start=2, chapter_end=2, error="err")]
+        prompt = build_synthesis_user_prompt(segs, failed_segments=failures)
+        assert re.findall(r"\[Segment (\d+):", prompt) == ["0", "1", "2"]
+
     def test_segment_summaries_included(self):
         """Segment summaries are included in synthesis prompt."""
         seg = SegmentResult(